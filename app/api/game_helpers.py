@@ -2,11 +2,11 @@
 
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from litestar.exceptions import NotFoundException
 
@@ -19,13 +19,48 @@ from app.models import (
     GameEvent,
     EventType,
 )
-from app.api.websocket import broadcast_to_game
+from app.api.websocket import note_game_code, schedule_broadcast
 
 
-async def broadcast_if_not_solo(game: Game, code: str, message: dict) -> None:
-    """Broadcast to game only if not in solo mode."""
-    if not game.is_solo:
-        await broadcast_to_game(code, message)
+def broadcast_if_not_solo(is_solo: bool, code: str, message: dict) -> None:
+    """
+    Schedule a broadcast to the game unless it is in solo mode.
+
+    Pass ``game.is_solo`` read before the commit; the expired game row would
+    otherwise have to be reloaded just for this flag.
+    """
+    if not is_solo:
+        schedule_broadcast(code, message)
+
+
+_GAME_ID_BY_CODE = select(Game.id).where(Game.code == bindparam("code"))
+
+
+async def _select_game_by_code(session: AsyncSession, code: str, stmt) -> Game:
+    """Run ``stmt`` (a ``select(Game)``) for the game with this join code."""
+    key = code.upper()
+    note_game_code(session, key)
+    result = await session.execute(stmt.where(Game.code == key))
+    game = result.unique().scalar_one_or_none()
+    if not game:
+        raise NotFoundException(f"Game with code '{code}' not found")
+    return game
+
+
+async def resolve_game_id(session: AsyncSession, code: str) -> uuid.UUID:
+    """
+    Resolve a join code to its game id without loading the game aggregate.
+
+    A single ``SELECT games.id`` on the unique code index; raises
+    NotFoundException if there is no such game.
+    """
+    key = code.upper()
+    note_game_code(session, key)
+    result = await session.execute(_GAME_ID_BY_CODE, {"code": key})
+    game_id = result.scalar_one_or_none()
+    if game_id is None:
+        raise NotFoundException(f"Game with code '{code}' not found")
+    return game_id
 
 
 async def get_game_by_code(
@@ -34,23 +69,55 @@ async def get_game_by_code(
     load_attached_heroes: bool = False,
 ) -> Game:
     """Fetch game by join code with relationships loaded."""
+    # Players -> units -> state is one linear chain (at most two players, one
+    # state per unit), so a single joined SELECT returns one row per unit with
+    # no cartesian product. Objectives would multiply those rows, so they and
+    # attached heroes stay on selectin.
+    units_path = joinedload(Game.players).joinedload(Player.units)
     stmt = (
         select(Game)
-        .where(Game.code == code.upper())
         .options(
-            selectinload(Game.players).selectinload(Player.units).selectinload(Unit.state),
+            units_path.joinedload(Unit.state),
             selectinload(Game.objectives),
+            raiseload("*", sql_only=True),
         )
     )
     if load_attached_heroes:
-        stmt = stmt.options(
-            selectinload(Game.players).selectinload(Player.units).selectinload(Unit.attached_heroes)
-        )
+        stmt = stmt.options(units_path.selectinload(Unit.attached_heroes))
+    return await _select_game_by_code(session, code, stmt)
+
+
+def index_units(game: Game) -> Dict[uuid.UUID, Unit]:
+    """Map unit id -> unit across all players of a loaded game."""
+    return {u.id: u for p in game.players for u in p.units}
+
+
+async def get_game_row(session: AsyncSession, code: str) -> Game:
+    """Fetch just the game row by join code (no relationships loaded)."""
+    return await _select_game_by_code(session, code, select(Game))
+
+
+async def get_unit_in_game(
+    session: AsyncSession,
+    game_id: uuid.UUID,
+    unit_id: uuid.UUID,
+    load_attached_heroes: bool = False,
+) -> Unit:
+    """Fetch one unit (with state) by id, scoped to the game's players."""
+    stmt = (
+        select(Unit)
+        .join(Player, Unit.player_id == Player.id)
+        .where(Unit.id == unit_id)
+        .where(Player.game_id == game_id)
+        .options(selectinload(Unit.state))
+    )
+    if load_attached_heroes:
+        stmt = stmt.options(selectinload(Unit.attached_heroes).selectinload(Unit.state))
     result = await session.execute(stmt)
-    game = result.scalar_one_or_none()
-    if not game:
-        raise NotFoundException(f"Game with code '{code}' not found")
-    return game
+    unit = result.scalar_one_or_none()
+    if not unit:
+        raise NotFoundException(f"Unit {unit_id} not found in game")
+    return unit
 
 
 def _utc_dt(dt: Optional[datetime]) -> Optional[datetime]:
@@ -95,9 +162,14 @@ async def log_event(
     target_objective_id: Optional[uuid.UUID] = None,
     details: Optional[dict] = None,
     previous_state: Optional[dict] = None,
+    events: Optional[List[GameEvent]] = None,
 ) -> GameEvent:
-    """Create and persist a game event."""
-    event = GameEvent.create(
+    """Create and persist a game event.
+
+    When ``events`` is given the event is appended there instead of being added
+    to the session, so callers can ``session.add_all`` a whole batch at once.
+    """
+    event = GameEvent(
         game_id=game.id,
         event_type=event_type,
         description=description,
@@ -108,5 +180,8 @@ async def log_event(
         details=details,
         previous_state=previous_state,
     )
-    session.add(event)
+    if events is not None:
+        events.append(event)
+    else:
+        session.add(event)
     return event
@@ -2,8 +2,9 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 
+import msgspec
 from pydantic import BaseModel, Field
 
 from app.models import (
@@ -243,8 +244,14 @@ class ObjectiveResponse(BaseModel):
         from_attributes = True
 
 
-class GameEventResponse(BaseModel):
-    """Game event response."""
+class GameEventResponse(msgspec.Struct):
+    """
+    Game event response.
+    
+    A msgspec Struct rather than a Pydantic model: the action log is polled on
+    every state_update, and Litestar encodes Structs natively without a
+    validation or model_dump pass.
+    """
     id: uuid.UUID
     event_type: EventType
     description: str
@@ -252,13 +259,10 @@ class GameEventResponse(BaseModel):
     player_id: Optional[uuid.UUID]
     target_unit_id: Optional[uuid.UUID]
     target_objective_id: Optional[uuid.UUID]
-    details: Optional[dict]
+    details: Optional[Dict[str, Any]]
     is_undone: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class GameResponse(BaseModel):
     """Full game state response."""
@@ -289,3 +293,91 @@ class GameWithUnitsResponse(GameResponse):
 class JoinGameResponse(GameWithUnitsResponse):
     """Response when joining a game - includes your player ID."""
     your_player_id: str = ""
+
+
+# Websocket "state" payload. Structs (like GameEventResponse) so the full state
+# is encoded in one msgspec pass straight from typed fields, with no dicts built
+# per player/unit. Field order is the JSON key order clients already receive.
+
+class UnitStateView(msgspec.Struct):
+    """Unit state inside the websocket game state."""
+    id: uuid.UUID
+    wounds_taken: int
+    models_remaining: int
+    activated_this_round: bool
+    is_shaken: bool
+    is_fatigued: bool
+    deployment_status: DeploymentStatus
+    transport_id: Optional[uuid.UUID]
+    spell_tokens: int
+    limited_weapons_used: Optional[List[str]]
+    custom_notes: Optional[str]
+
+
+class UnitView(msgspec.Struct):
+    """Unit inside the websocket game state."""
+    id: uuid.UUID
+    player_id: uuid.UUID
+    name: str
+    custom_name: Optional[str]
+    quality: int
+    defense: int
+    size: int
+    tough: int
+    cost: int
+    loadout: Optional[List[Any]]
+    rules: Optional[List[Any]]
+    is_hero: bool
+    is_caster: bool
+    caster_level: int
+    is_transport: bool
+    transport_capacity: int
+    has_ambush: bool
+    has_scout: bool
+    attached_to_unit_id: Optional[uuid.UUID]
+    upgrades: Optional[List[Any]]
+    state: Optional[UnitStateView]
+
+
+class PlayerView(msgspec.Struct):
+    """Player inside the websocket game state."""
+    id: uuid.UUID
+    name: str
+    color: str
+    is_host: bool
+    is_connected: bool
+    army_name: Optional[str]
+    army_forge_list_id: Optional[str]
+    starting_unit_count: int
+    starting_points: int
+    has_finished_activations: bool
+    spells: Optional[List[Any]]
+    special_rules: Optional[List[Any]]
+    faction_name: Optional[str]
+    army_book_version: Optional[str]
+    victory_points: int
+
+
+class ObjectiveView(msgspec.Struct):
+    """Objective inside the websocket game state."""
+    id: uuid.UUID
+    marker_number: int
+    label: Optional[str]
+    status: ObjectiveStatus
+    controlled_by_id: Optional[uuid.UUID]
+
+
+class GameStateView(msgspec.Struct):
+    """Full game state sent over the websocket (``{"type": "state"}``)."""
+    id: uuid.UUID
+    code: str
+    name: str
+    game_system: GameSystem
+    status: GameStatus
+    current_round: int
+    max_rounds: int
+    current_player_id: Optional[uuid.UUID]
+    first_player_next_round_id: Optional[uuid.UUID]
+    players: List[PlayerView]
+    units: List[UnitView]
+    objectives: List[ObjectiveView]
@@ -1,15 +1,116 @@
 """Shared helpers for game API route handlers."""
 
-from app.api.game_schemas import UnitResponse
-from app.models import Unit
+from itertools import chain
+from typing import Any, Dict, List, Mapping, Optional, Type, TypeVar
+
+from litestar import MediaType, Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.api.game_schemas import (
+    GameEventResponse,
+    GameResponse,
+    GameWithUnitsResponse,
+    JoinGameResponse,
+    ObjectiveResponse,
+    PlayerResponse,
+    UnitResponse,
+    UnitStateResponse,
+)
+from app.models import Game, GameEvent, Objective, Player, Unit, UnitState
 from app.utils.unit_stats import get_effective_caster
 
+# Response builders below use model_construct, which skips Pydantic validation.
+# That is only safe because the input is ORM rows whose column types already
+# match the response schemas; never use them on request bodies or other
+# untrusted data (request DTOs keep going through model_validate).
+
+M = TypeVar("M", bound=BaseModel)
+
+_NESTED_FIELDS = ("players", "objectives", "units", "state", "your_player_id")
+
+
+def _attrs(model: Type[BaseModel], obj: Any) -> Dict[str, Any]:
+    """Read the model's flat fields straight off an ORM instance."""
+    return {name: getattr(obj, name) for name in model.model_fields if name not in _NESTED_FIELDS}
+
+
+def player_response(player: Player) -> PlayerResponse:
+    return PlayerResponse.model_construct(**_attrs(PlayerResponse, player))
+
+
+def unit_state_response(state: UnitState) -> UnitStateResponse:
+    return UnitStateResponse.model_construct(**_attrs(UnitStateResponse, state))
+
+
+def objective_response(objective: Objective) -> ObjectiveResponse:
+    return ObjectiveResponse.model_construct(**_attrs(ObjectiveResponse, objective))
+
+
+def event_response(event: GameEvent) -> GameEventResponse:
+    return GameEventResponse(
+        id=event.id,
+        event_type=event.event_type,
+        description=event.description,
+        round_number=event.round_number,
+        player_id=event.player_id,
+        target_unit_id=event.target_unit_id,
+        target_objective_id=event.target_objective_id,
+        details=event.details,
+        is_undone=event.is_undone,
+        created_at=event.created_at,
+    )
+
 
 def unit_response_with_effective_caster(unit: Unit) -> UnitResponse:
     """Build UnitResponse with is_caster/caster_level from DB or from rules/loadout/upgrades."""
-    resp = UnitResponse.model_validate(unit)
+    data = _attrs(UnitResponse, unit)
     effective_caster, effective_level = get_effective_caster(unit)
-    resp.is_caster = effective_caster
+    data["is_caster"] = effective_caster
     if effective_caster:
-        resp.caster_level = effective_level or resp.caster_level or 1
-    return resp
+        data["caster_level"] = effective_level or data["caster_level"] or 1
+    data["state"] = unit_state_response(unit.state) if unit.state else None
+    return UnitResponse.model_construct(**data)
+
+
+def unit_responses(game: Game) -> List[UnitResponse]:
+    """UnitResponse for every unit of every player, in player order."""
+    return [
+        unit_response_with_effective_caster(u)
+        for u in chain.from_iterable(p.units for p in game.players)
+    ]
+
+
+def game_response(game: Game, model: Type[M] = GameResponse, **extra: Any) -> M:
+    """
+    Build a GameResponse (or subclass) from a game with players and objectives loaded.
+    
+    ``extra`` fills subclass-only fields, e.g. ``units`` or ``your_player_id``.
+    """
+    data = _attrs(model, game)
+    data["players"] = [player_response(p) for p in game.players]
+    data["objectives"] = [objective_response(o) for o in game.objectives]
+    data.update(extra)
+    return model.model_construct(**data)
+
+
+# Serializers for the hot read paths. pydantic-core writes JSON bytes directly,
+# and Litestar sends bytes content untouched, so the response skips the
+# model_dump -> dict -> msgspec round trip.
+GAME_JSON = TypeAdapter(GameResponse)
+GAME_WITH_UNITS_JSON = TypeAdapter(GameWithUnitsResponse)
+JOIN_GAME_JSON = TypeAdapter(JoinGameResponse)
+
+
+def json_response(
+    adapter: TypeAdapter,
+    value: Any,
+    headers: Optional[Mapping[str, str]] = None,
+    status_code: Optional[int] = None,
+) -> Response:
+    """Serialize ``value`` with ``adapter`` into a ready-to-send JSON response."""
+    return Response(
+        content=adapter.dump_json(value),
+        media_type=MediaType.JSON,
+        headers=headers,
+        status_code=status_code,
+    )
@@ -1,20 +1,43 @@
 """Game event log API."""
 
+import base64
+import binascii
+import uuid
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional, Tuple
 
 from litestar import Controller, delete, get, status_codes
-from litestar.exceptions import HTTPException
+from litestar.exceptions import HTTPException, ValidationException
 from litestar.response import Response
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.game_helpers import broadcast_if_not_solo, get_game_by_code
+from app.api.game_helpers import get_game_by_code, resolve_game_id
 from app.api.game_schemas import GameEventResponse
+from app.api.games.common import event_response
+from app.api.websocket import schedule_broadcast
 from app.models import GameEvent
 from app.utils.rate_limit import check_rate_limit
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_event_cursor(event: GameEvent) -> str:
+    """Opaque keyset cursor pointing just past ``event`` in the action log."""
+    raw = f"{event.created_at.isoformat()}|{event.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_event_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Inverse of ``_encode_event_cursor``; rejects anything malformed."""
+    try:
+        created_at, event_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(event_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationException("Invalid events cursor") from e
+
+
 class GamesEventsController(Controller):
     """Action log: list, export, clear."""
 
@@ -27,23 +50,36 @@ class GamesEventsController(Controller):
         code: str,
         session: AsyncSession,
         limit: int = 50,
-        offset: int = 0,
-    ) -> List[GameEventResponse]:
-        """Get game events (action log)."""
-        game = await get_game_by_code(session, code)
+        before: Optional[str] = None,
+    ) -> Response[List[GameEventResponse]]:
+        """
+        Get game events (action log), newest first.
+        
+        Pages by keyset: pass the ``X-Next-Cursor`` header of the previous
+        page as ``before`` to continue. The header is only set when the page
+        is full.
+        """
+        game_id = await resolve_game_id(session, code)
         
         stmt = (
             select(GameEvent)
-            .where(GameEvent.game_id == game.id)
+            .where(GameEvent.game_id == game_id)
             .where(GameEvent.is_undone == False)
-            .order_by(GameEvent.created_at.desc())
-            .offset(offset)
+            .order_by(GameEvent.created_at.desc(), GameEvent.id.desc())
             .limit(limit)
         )
+        if before:
+            cursor_ts, cursor_id = _decode_event_cursor(before)
+            # Row comparison rather than an OR of ranges, so Postgres can seek
+            # straight into the (game_id, created_at, id) index.
+            stmt = stmt.where(tuple_(GameEvent.created_at, GameEvent.id) < (cursor_ts, cursor_id))
         result = await session.execute(stmt)
         events = result.scalars().all()
         
-        return [GameEventResponse.model_validate(e) for e in events]
+        headers = {}
+        if events and len(events) == limit:
+            headers[NEXT_CURSOR_HEADER] = _encode_event_cursor(events[-1])
+        return Response(content=[event_response(e) for e in events], headers=headers)
     
     @get("/{code:str}/events/export")
     async def export_events(
@@ -115,15 +151,13 @@ class GamesEventsController(Controller):
         
         await session.commit()
         
-        # Reload game to get current state for broadcast
-        game = await get_game_by_code(session, code)
-        
         # Broadcast state update - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "state_update",
-            "data": {
-                "reason": "events_cleared",
-            }
-        })
+        if not is_solo_value:
+            schedule_broadcast(code, {
+                "type": "state_update",
+                "data": {
+                    "reason": "events_cleared",
+                }
+            })
         
         return {"success": True, "deleted_count": deleted_count}
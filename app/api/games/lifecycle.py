@@ -4,12 +4,11 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
-from litestar import Controller, get, post, patch
+from litestar import Controller, Response, get, post, patch, status_codes
 from litestar.exceptions import ValidationException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.game_helpers import (
-    broadcast_if_not_solo,
     check_and_update_expiration,
     get_game_by_code,
     log_event,
@@ -22,7 +21,15 @@ from app.api.game_schemas import (
     JoinGameResponse,
     UpdateGameStateRequest,
 )
-from app.api.games.common import unit_response_with_effective_caster
+from app.api.games.common import (
+    GAME_JSON,
+    GAME_WITH_UNITS_JSON,
+    JOIN_GAME_JSON,
+    game_response,
+    json_response,
+    unit_responses,
+)
+from app.api.websocket import note_game_code, schedule_broadcast
 from app.models import (
     EventType,
     Game,
@@ -47,7 +54,7 @@ class GamesLifecycleController(Controller):
         self,
         data: CreateGameRequest,
         session: AsyncSession,
-    ) -> GameResponse:
+    ) -> Response[GameResponse]:
         """Create a new game and return the join code."""
         logger.info(f"Creating new game: '{data.name}' ({data.game_system})")
         
@@ -62,6 +69,7 @@ class GamesLifecycleController(Controller):
             await session.flush()  # Get game ID
             
             logger.debug(f"Game created with code: {game.code}")
+            note_game_code(session, game.code)
             
             # Create host player
             player = Player(
@@ -96,13 +104,16 @@ class GamesLifecycleController(Controller):
                 player_id=player.id,
             )
             
+            # Read these before commit expires the instances
+            game_code, host_name = game.code, player.name
             await session.commit()
-            await session.refresh(game)
             
             # Reload with relationships
-            game = await get_game_by_code(session, game.code)
-            logger.info(f"Game created successfully: {game.code} (host: {player.name})")
-            return GameResponse.model_validate(game)
+            game = await get_game_by_code(session, game_code)
+            logger.info(f"Game created successfully: {game_code} (host: {host_name})")
+            return json_response(
+                GAME_JSON, game_response(game), status_code=status_codes.HTTP_201_CREATED
+            )
         except Exception as e:
             error_log(
                 "Failed to create game",
@@ -120,7 +131,7 @@ class GamesLifecycleController(Controller):
         self,
         code: str,
         session: AsyncSession,
-    ) -> GameWithUnitsResponse:
+    ) -> Response[GameWithUnitsResponse]:
         """Get game state by join code."""
         game = await get_game_by_code(session, code)
         
@@ -129,14 +140,11 @@ class GamesLifecycleController(Controller):
         if game.status == GameStatus.EXPIRED:
             await session.commit()  # pragma: no cover
         
-        # Collect all units from all players
-        units = []
-        for player in game.players:
-            units.extend(player.units)
-        
-        response = GameWithUnitsResponse.model_validate(game)
-        response.units = [unit_response_with_effective_caster(u) for u in units]
-        return response
+        return json_response(GAME_WITH_UNITS_JSON, game_response(
+            game,
+            GameWithUnitsResponse,
+            units=unit_responses(game),
+        ))
     
     @post("/{code:str}/join")
     async def join_game(
@@ -144,7 +152,7 @@ class GamesLifecycleController(Controller):
         code: str,
         data: JoinGameRequest,
         session: AsyncSession,
-    ) -> JoinGameResponse:
+    ) -> Response[JoinGameResponse]:
         """Join an existing game as a new player."""
         game = await get_game_by_code(session, code)
         
@@ -184,39 +192,40 @@ class GamesLifecycleController(Controller):
         
         await session.commit()
         
-        # Reload game to get is_solo flag
+        # Reload game (is_solo flag and response)
         game = await get_game_by_code(session, code)
         
-        # Broadcast to WebSocket clients (notify host) - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "player_joined",
-            "player": {
-                "id": str(player_id),
-                "name": player_name,
-                "color": player_color,
-                "is_host": False,
-                "is_connected": False,
-            }
-        })
-        logger.info(f"Player {player_name} joined game {code}, broadcast sent")
-        
-        # Reload game
-        game = await get_game_by_code(session, code)
-        units = []
-        for p in game.players:
-            units.extend(p.units)
-        
-        response = JoinGameResponse.model_validate(game)
-        response.units = [unit_response_with_effective_caster(u) for u in units]
-        response.your_player_id = str(player_id)  # Tell client which player they are
-        return response
+        # Notify the host in the background - skip for solo games
+        if not game.is_solo:
+            schedule_broadcast(code, {
+                "type": "player_joined",
+                "player": {
+                    "id": str(player_id),
+                    "name": player_name,
+                    "color": player_color,
+                    "is_host": False,
+                    "is_connected": False,
+                }
+            })
+            logger.info(f"Player {player_name} joined game {code}, broadcast scheduled")
+        
+        return json_response(
+            JOIN_GAME_JSON,
+            game_response(
+                game,
+                JoinGameResponse,
+                units=unit_responses(game),
+                your_player_id=str(player_id),  # Tell client which player they are
+            ),
+            status_code=status_codes.HTTP_201_CREATED,
+        )
     
     @post("/{code:str}/start")
     async def start_game(
         self,
         code: str,
         session: AsyncSession,
-    ) -> GameWithUnitsResponse:
+    ) -> Response[GameWithUnitsResponse]:
         """Start the game (transition from lobby to in_progress)."""
         game = await get_game_by_code(session, code)
         
@@ -261,26 +270,27 @@ class GamesLifecycleController(Controller):
         
         await session.commit()
         
-        # Reload game to get is_solo flag
-        game = await get_game_by_code(session, code)
-        
-        # Broadcast to WebSocket clients - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "game_started",
-            "status": "in_progress",
-            "current_round": 1,
-        })
-        logger.info(f"Game {code} started, broadcast sent")
-        
-        # Reload game
+        # Reload game (is_solo flag and response)
         game = await get_game_by_code(session, code)
-        units = []
-        for p in game.players:
-            units.extend(p.units)
         
-        response = GameWithUnitsResponse.model_validate(game)
-        response.units = [unit_response_with_effective_caster(u) for u in units]
-        return response
+        # Broadcast in the background - skip for solo games
+        if not game.is_solo:
+            schedule_broadcast(code, {
+                "type": "game_started",
+                "status": "in_progress",
+                "current_round": 1,
+            })
+            logger.info(f"Game {code} started, broadcast scheduled")
+        
+        return json_response(
+            GAME_WITH_UNITS_JSON,
+            game_response(
+                game,
+                GameWithUnitsResponse,
+                units=unit_responses(game),
+            ),
+            status_code=status_codes.HTTP_201_CREATED,
+        )
     
     @patch("/{code:str}/state")
     async def update_game_state(
@@ -288,7 +298,7 @@ class GamesLifecycleController(Controller):
         code: str,
         data: UpdateGameStateRequest,
         session: AsyncSession,
-    ) -> GameResponse:
+    ) -> Response[GameResponse]:
         """Update game state (round, turn, status)."""
         game = await get_game_by_code(session, code)
         
@@ -328,13 +338,14 @@ class GamesLifecycleController(Controller):
         await session.commit()
         await session.refresh(game)
         
-        # Broadcast state update to other clients - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "state_update",
-            "data": {
-                "current_round": game.current_round,
-                "status": game.status.value,
-            }
-        })
+        # Broadcast state update to other clients in the background - skip for solo games
+        if not game.is_solo:
+            schedule_broadcast(code, {
+                "type": "state_update",
+                "data": {
+                    "current_round": game.current_round,
+                    "status": game.status.value,
+                }
+            })
         
-        return GameResponse.model_validate(game)
+        return json_response(GAME_JSON, game_response(game))
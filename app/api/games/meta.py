@@ -5,10 +5,13 @@ from datetime import datetime, timezone
 
 from litestar import Controller, patch
 from litestar.exceptions import NotFoundException, ValidationException
-from sqlalchemy import select
+from sqlalchemy import case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.api.game_helpers import broadcast_if_not_solo, get_game_by_code, log_event
+from app.api.game_helpers import get_game_by_code, get_game_row, log_event
+from app.api.games.common import game_response, player_response
+from app.api.websocket import debounce_broadcast, note_game_code, schedule_broadcast
 from app.api.game_schemas import (
     GameResponse,
     PlayerResponse,
@@ -16,7 +19,16 @@ from app.api.game_schemas import (
     UpdateRoundRequest,
     UpdateVictoryPointsRequest,
 )
-from app.models import EventType, GameEvent, GameStatus
+from app.models import EventType, Game, GameEvent, GameStatus, Player, Unit
+
+
+def _at_least(floor: int, expr):
+    """SQL ``max(floor, expr)``; portable stand-in for GREATEST (missing on SQLite)."""
+    return case((expr < floor, floor), else_=expr)
+
+
+def _vp_description(player_name: str, vp_before: int, delta: int) -> str:
+    return f"{player_name} VP: {vp_before} → {vp_before + delta} (+{delta})"
 
 
 class GamesMetaController(Controller):
@@ -34,73 +46,102 @@ class GamesMetaController(Controller):
         session: AsyncSession,
     ) -> PlayerResponse:
         """Update a player's victory points."""
-        game = await get_game_by_code(session, code)
+        game = await get_game_row(session, code)
+        is_solo = game.is_solo
         
         # Update activity tracking
         game.last_activity_at = datetime.now(timezone.utc)
         
-        # Find the player
-        player = next((p for p in game.players if p.id == player_id), None)
+        # Apply the delta in the database (clamped at 0) so concurrent clicks
+        # can't race each other; RETURNING hands back the updated player.
+        result = await session.execute(
+            update(Player)
+            .where(Player.id == player_id)
+            .where(Player.game_id == game.id)
+            .values(victory_points=_at_least(0, Player.victory_points + data.delta))
+            .returning(Player)
+        )
+        player = result.scalar_one_or_none()
         if not player:
             raise NotFoundException(f"Player {player_id} not found in game")
         
-        # Store the VP before the change
-        vp_before = player.victory_points
-        
-        # Update VP
-        player.victory_points = max(0, player.victory_points + data.delta)  # Prevent negative VP
-        
         if data.delta > 0:
-            # Adding VP: Create one log entry for each point added
-            for i in range(data.delta):
-                vp_at_this_point = vp_before + i
-                await log_event(
-                    session, game,
-                    EventType.VP_CHANGED,
-                    f"{player.name} VP: {vp_at_this_point} → {vp_at_this_point + 1} (+1)",
-                    player_id=player_id,
-                    details={
-                        "vp_before": vp_at_this_point,
-                        "vp_after": vp_at_this_point + 1,
-                        "delta": 1,
-                    },
-                )
+            # Never clamped when adding, so the pre-update total is recoverable
+            vp_before = player.victory_points - data.delta
+            # Adding VP: one log entry for the whole change
+            await log_event(
+                session, game,
+                EventType.VP_CHANGED,
+                _vp_description(player.name, vp_before, data.delta),
+                player_id=player_id,
+                details={
+                    "vp_before": vp_before,
+                    "vp_after": vp_before + data.delta,
+                    "delta": data.delta,
+                },
+            )
         elif data.delta < 0:
-            # Removing VP: Delete the most recent VP_CHANGED events (one per point removed)
-            # This removes the corresponding "add" entries to reduce log clutter
-            events_to_delete = abs(data.delta)
+            # Removing VP: walk back the most recent VP_CHANGED entries instead of
+            # logging a removal, to reduce log clutter. Entries fully covered by
+            # the removal are marked undone; a partially covered one has its delta reduced.
+            remaining = -data.delta
+            undone_ids = []
             stmt = (
                 select(GameEvent)
                 .where(GameEvent.game_id == game.id)
                 .where(GameEvent.event_type == EventType.VP_CHANGED)
                 .where(GameEvent.player_id == player_id)
                 .where(GameEvent.is_undone == False)
-                .order_by(GameEvent.created_at.desc())
-                .limit(events_to_delete)
+                .order_by(GameEvent.created_at.desc(), GameEvent.id.desc())
+                .limit(remaining)
             )
             result = await session.execute(stmt)
-            events_to_remove = result.scalars().all()
             
-            for event in events_to_remove:
-                await session.delete(event)
+            for event in result.scalars():
+                details = event.details or {}
+                event_delta = details.get("delta", 1)
+                if event_delta <= remaining:
+                    remaining -= event_delta
+                    undone_ids.append(event.id)
+                else:
+                    kept = event_delta - remaining
+                    event.details = {
+                        **details,
+                        "vp_after": details.get("vp_before", 0) + kept,
+                        "delta": kept,
+                    }
+                    event.description = _vp_description(player.name, details.get("vp_before", 0), kept)
+                    remaining = 0
+                if remaining == 0:
+                    break
+            
+            if undone_ids:
+                await session.execute(
+                    update(GameEvent)
+                    .where(GameEvent.id.in_(undone_ids))
+                    .values(is_undone=True)
+                )
         
+        response = player_response(player)
         await session.commit()
-        await session.refresh(player)
-        
-        # Reload game to get is_solo flag
-        game = await get_game_by_code(session, code)
         
-        # Broadcast state update - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "state_update",
-            "data": {
-                "reason": "victory_points_updated",
-                "player_id": str(player_id),
-                "victory_points": player.victory_points,
-            }
-        })
+        # Broadcast state update - skip for solo games. Rapid clicks are
+        # coalesced per player so subscribers only see the final total.
+        if not is_solo:
+            debounce_broadcast(
+                code,
+                {
+                    "type": "state_update",
+                    "data": {
+                        "reason": "victory_points_updated",
+                        "player_id": str(player_id),
+                        "victory_points": response.victory_points,
+                    }
+                },
+                key=("victory_points_updated", player_id),
+            )
         
-        return PlayerResponse.model_validate(player)
+        return response
     
     @patch("/{code:str}/players/{player_id:uuid}")
     async def update_player_name(
@@ -145,7 +186,7 @@ class GamesMetaController(Controller):
             "army_book_version": player.army_book_version,
         }
         await session.commit()
-        return PlayerResponse.model_validate(out_data)
+        return PlayerResponse.model_construct(**out_data)
     
     @patch("/{code:str}/round")
     async def update_round(
@@ -155,17 +196,35 @@ class GamesMetaController(Controller):
         session: AsyncSession,
     ) -> GameResponse:
         """Update the game round."""
-        game = await get_game_by_code(session, code)
-        
-        # Update activity tracking
-        game.last_activity_at = datetime.now(timezone.utc)
-        
-        # Store the round before the change
-        round_before = game.current_round
+        # Apply the delta in the database (never below round 1) and update
+        # activity tracking in the same statement.
+        note_game_code(session, code.upper())
+        result = await session.execute(
+            update(Game)
+            .where(Game.code == code.upper())
+            .values(
+                current_round=_at_least(1, Game.current_round + data.delta),
+                last_activity_at=datetime.now(timezone.utc),
+            )
+            .returning(Game.id, Game.current_round)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise NotFoundException(f"Game with code '{code}' not found")
+        game_id, new_round = row
+        round_before = new_round - data.delta  # only meaningful when delta > 0 (never clamped)
         
-        # Update round (ensure it doesn't go below 1)
-        new_round = max(1, game.current_round + data.delta)
-        game.current_round = new_round
+        # Players and objectives feed the response; units are only needed to
+        # reset per-round state when a new round starts.
+        options = [selectinload(Game.players), selectinload(Game.objectives)]
+        if data.delta > 0:
+            options.append(
+                selectinload(Game.players).selectinload(Player.units).selectinload(Unit.state)
+            )
+        result = await session.execute(
+            select(Game).where(Game.id == game_id).options(*options)
+        )
+        game = result.scalar_one()
         
         # Log event or delete log entry
         if data.delta > 0:
@@ -182,32 +241,35 @@ class GamesMetaController(Controller):
                 f"Round changed: {round_before} → {new_round} (+{data.delta})",
             )
         elif data.delta < 0:
-            # Round decreased: Delete the most recent ROUND_STARTED event
-            stmt = (
-                select(GameEvent)
+            # Round decreased: mark the most recent ROUND_STARTED event undone
+            latest_round_event = (
+                select(GameEvent.id)
                 .where(GameEvent.game_id == game.id)
                 .where(GameEvent.event_type == EventType.ROUND_STARTED)
                 .where(GameEvent.is_undone == False)
-                .order_by(GameEvent.created_at.desc())
+                .order_by(GameEvent.created_at.desc(), GameEvent.id.desc())
                 .limit(1)
+                .scalar_subquery()
+            )
+            await session.execute(
+                update(GameEvent)
+                .where(GameEvent.id == latest_round_event)
+                .values(is_undone=True)
+                .execution_options(synchronize_session=False)
             )
-            result = await session.execute(stmt)
-            recent_round_event = result.scalar_one_or_none()
-            
-            if recent_round_event:
-                await session.delete(recent_round_event)
         
+        response = game_response(game)
         await session.commit()
-        await session.refresh(game)
         
         # Broadcast state update - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "state_update",
-            "data": {
-                "reason": "round_updated",
-                "current_round": new_round,
-            }
-        })
+        if not response.is_solo:
+            schedule_broadcast(code, {
+                "type": "state_update",
+                "data": {
+                    "reason": "round_updated",
+                    "current_round": new_round,
+                }
+            })
         
-        return GameResponse.model_validate(game)
+        return response
     
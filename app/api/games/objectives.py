@@ -6,11 +6,14 @@ from typing import List
 
 from litestar import Controller, patch, post
 from litestar.exceptions import NotFoundException, ValidationException
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.game_helpers import broadcast_if_not_solo, get_game_by_code, log_event
+from app.api.game_helpers import get_game_row, log_event, resolve_game_id
 from app.api.game_schemas import CreateObjectivesRequest, ObjectiveResponse, UpdateObjectiveRequest
-from app.models import EventType, Objective, ObjectiveStatus
+from app.api.games.common import objective_response
+from app.api.websocket import schedule_broadcast
+from app.models import EventType, Objective, ObjectiveStatus, Player
 
 
 class GamesObjectivesController(Controller):
@@ -28,17 +31,19 @@ class GamesObjectivesController(Controller):
         session: AsyncSession,
     ) -> ObjectiveResponse:
         """Update an objective's state."""
-        game = await get_game_by_code(session, code)
+        game = await get_game_row(session, code)
+        is_solo = game.is_solo
         
         # Update activity tracking
         game.last_activity_at = datetime.now(timezone.utc)
         
         # Find the objective
-        objective = None
-        for obj in game.objectives:
-            if obj.id == objective_id:
-                objective = obj
-                break
+        result = await session.execute(
+            select(Objective)
+            .where(Objective.id == objective_id)
+            .where(Objective.game_id == game.id)
+        )
+        objective = result.scalar_one_or_none()
         
         if not objective:
             raise NotFoundException(f"Objective {objective_id} not found in game")
@@ -50,11 +55,12 @@ class GamesObjectivesController(Controller):
         # Log the change
         if data.status == ObjectiveStatus.SEIZED and data.controlled_by_id:
             # Find player name
-            player_name = "Unknown"
-            for p in game.players:
-                if p.id == data.controlled_by_id:
-                    player_name = p.name
-                    break
+            result = await session.execute(
+                select(Player.name)
+                .where(Player.id == data.controlled_by_id)
+                .where(Player.game_id == game.id)
+            )
+            player_name = result.scalar_one_or_none() or "Unknown"
             
             await log_event(
                 session, game,
@@ -81,19 +87,17 @@ class GamesObjectivesController(Controller):
         await session.commit()
         await session.refresh(objective)
         
-        # Reload game to get is_solo flag
-        game = await get_game_by_code(session, code)
-        
         # Broadcast state update to trigger event fetching on other clients - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "state_update",
-            "data": {
-                "reason": "objective_updated",
-                "objective_id": str(objective_id),
-            }
-        })
+        if not is_solo:
+            schedule_broadcast(code, {
+                "type": "state_update",
+                "data": {
+                    "reason": "objective_updated",
+                    "objective_id": str(objective_id),
+                }
+            })
         
-        return ObjectiveResponse.model_validate(objective)
+        return objective_response(objective)
     
     @post("/{code:str}/objectives")
     async def create_objectives(
@@ -103,24 +107,20 @@ class GamesObjectivesController(Controller):
         session: AsyncSession,
     ) -> List[ObjectiveResponse]:
         """Create objective markers for a game."""
-        game = await get_game_by_code(session, code)
+        game_id = await resolve_game_id(session, code)
         
-        if game.objectives:
+        existing = await session.execute(
+            select(Objective.id).where(Objective.game_id == game_id).limit(1)
+        )
+        if existing.first() is not None:
             raise ValidationException("Objectives already exist for this game")
         
-        objectives = []
-        for i in range(1, data.count + 1):
-            obj = Objective(
-                game_id=game.id,
-                marker_number=i,
-            )
-            session.add(obj)
-            objectives.append(obj)
+        # One multi-row INSERT ... RETURNING instead of add + refresh per marker
+        result = await session.execute(
+            insert(Objective).returning(Objective, sort_by_parameter_order=True),
+            [{"game_id": game_id, "marker_number": i} for i in range(1, data.count + 1)],
+        )
+        response = [objective_response(obj) for obj in result.scalars()]
         
         await session.commit()
-        
-        # Refresh to get IDs
-        for obj in objectives:
-            await session.refresh(obj)
-        
-        return [ObjectiveResponse.model_validate(obj) for obj in objectives]
+        return response
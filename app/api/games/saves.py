@@ -19,7 +19,7 @@ from app.api.game_schemas import (
     SaveGameRequest,
     SaveGameResponse,
 )
-from app.api.games.common import unit_response_with_effective_caster
+from app.api.games.common import game_response, unit_responses
 from app.models import (
     DeploymentStatus,
     EventType,
@@ -50,14 +50,14 @@ class GamesSavesController(Controller):
             raise ValidationException("Save/load is only available for solo games")
         
         # Get full game state (include units from all players, same as get_game)
-        game_response = GameWithUnitsResponse.model_validate(game)
-        units = []
-        for p in game.players:
-            units.extend(p.units)
-        game_response.units = [unit_response_with_effective_caster(u) for u in units]
+        snapshot = game_response(
+            game,
+            GameWithUnitsResponse,
+            units=unit_responses(game),
+        )
         
         # Serialize to JSON
-        game_state_json = json.dumps(game_response.model_dump(), default=str)
+        game_state_json = json.dumps(snapshot.model_dump(), default=str)
         
         # Create save
         game_save = GameSave(
@@ -258,9 +258,8 @@ class GamesSavesController(Controller):
         
         # Return restored state
         game = await get_game_by_code(session, code, load_attached_heroes=True)
-        units = []
-        for p in game.players:
-            units.extend(p.units)
-        response = GameWithUnitsResponse.model_validate(game)
-        response.units = [unit_response_with_effective_caster(u) for u in units]
-        return response
+        return game_response(
+            game,
+            GameWithUnitsResponse,
+            units=unit_responses(game),
+        )
@@ -8,7 +8,7 @@ from litestar import Controller, post
 from litestar.exceptions import NotFoundException, ValidationException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.game_helpers import broadcast_if_not_solo, get_game_by_code, log_event
+from app.api.game_helpers import broadcast_if_not_solo, get_game_by_code, index_units, log_event
 from app.api.game_schemas import CastSpellRequest, LogUnitActionRequest
 from app.models import DeploymentStatus, EventType
 from app.utils.logging import log_exception_with_context
@@ -43,17 +43,11 @@ class GamesUnitsCombatController(Controller):
             game.last_activity_at = datetime.now(timezone.utc)
             
             # Find the unit
-            unit = None
-            unit_player_id = None
-            for player in game.players:
-                for u in player.units:
-                    if u.id == unit_id:
-                        unit = u
-                        unit_player_id = player.id
-                        break
-            
+            units_by_id = index_units(game)
+            unit = units_by_id.get(unit_id)
             if not unit:
                 raise NotFoundException(f"Unit {unit_id} not found in game")
+            unit_player_id = unit.player_id
             
             if not unit.state:
                 raise ValidationException("Unit has no state (not initialized)")
@@ -84,23 +78,13 @@ class GamesUnitsCombatController(Controller):
                     except (ValueError, TypeError) as e:  # pragma: no cover
                         raise ValidationException(f"Invalid target unit ID format: {target_id}")
                     
-                    target_found = False
-                    for player in game.players:
-                        if player.id == unit_player_id:
-                            continue  # Skip the unit's own player
-                        for u in player.units:
-                            if u.id == target_uuid:
-                                if u.state and u.state.deployment_status == DeploymentStatus.DESTROYED:
-                                    raise ValidationException(f"Cannot target destroyed unit: {u.display_name}")
-                                target_units.append(u)
-                                target_names.append(u.display_name)
-                                target_found = True
-                                break
-                        if target_found:
-                            break
-                    
-                    if not target_found:
+                    u = units_by_id.get(target_uuid)
+                    if not u or u.player_id == unit_player_id:
                         raise NotFoundException(f"Target unit {target_id} not found or belongs to same player")
+                    if u.state and u.state.deployment_status == DeploymentStatus.DESTROYED:
+                        raise ValidationException(f"Cannot target destroyed unit: {u.display_name}")
+                    target_units.append(u)
+                    target_names.append(u.display_name)
             
             # Map action to EventType
             action_to_event = {
@@ -164,13 +148,11 @@ class GamesUnitsCombatController(Controller):
                 details=details if details else None,
             )
             
+            is_solo = game.is_solo
             await session.commit()
             
-            # Reload game to get is_solo flag
-            game = await get_game_by_code(session, code)
-            
             # Broadcast state update - skip for solo games
-            await broadcast_if_not_solo(game, code, {
+            broadcast_if_not_solo(is_solo, code, {
                 "type": "state_update",
                 "data": {
                     "reason": "unit_action_logged",
@@ -209,17 +191,11 @@ class GamesUnitsCombatController(Controller):
         game = await get_game_by_code(session, code, load_attached_heroes=True)
         game.last_activity_at = datetime.now(timezone.utc)
         
-        unit = None
-        unit_player_id = None
-        for player in game.players:
-            for u in player.units:
-                if u.id == unit_id:
-                    unit = u
-                    unit_player_id = player.id
-                    break
-        
+        units_by_id = index_units(game)
+        unit = units_by_id.get(unit_id)
         if not unit:
             raise NotFoundException(f"Unit {unit_id} not found in game")
+        unit_player_id = unit.player_id
         if not unit.state:
             raise ValidationException("Unit has no state")
         effective_caster, _ = get_effective_caster(unit)
@@ -236,12 +212,9 @@ class GamesUnitsCombatController(Controller):
         
         spell_label = data.spell_name or f"Spell ({data.spell_value})"
         target_desc = ""
-        if data.target_unit_id:
-            for p in game.players:
-                for u in p.units:
-                    if u.id == data.target_unit_id:
-                        target_desc = f" on {u.display_name}"
-                        break
+        target = units_by_id.get(data.target_unit_id) if data.target_unit_id else None
+        if target:
+            target_desc = f" on {target.display_name}"
         
         result_desc = "succeeded" if data.success else "failed"
         description = f"{unit.display_name} cast {spell_label}{target_desc} — {result_desc}"
@@ -260,11 +233,10 @@ class GamesUnitsCombatController(Controller):
                 "tokens_remaining": unit.state.spell_tokens,
             },
         )
+        is_solo = game.is_solo
         await session.commit()
         
-        game = await get_game_by_code(session, code)
-        
-        await broadcast_if_not_solo(game, code, {
+        broadcast_if_not_solo(is_solo, code, {
             "type": "state_update",
             "data": {
                 "reason": "spell_cast",
@@ -6,10 +6,16 @@ from datetime import datetime, timezone
 
 from litestar import Controller, delete, patch, post, status_codes
 from litestar.exceptions import HTTPException, NotFoundException, ValidationException
-from sqlalchemy import select
+from sqlalchemy import delete as sql_delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.game_helpers import broadcast_if_not_solo, get_game_by_code, log_event
+from app.api.game_helpers import (
+    broadcast_if_not_solo,
+    get_game_by_code,
+    get_game_row,
+    get_unit_in_game,
+    log_event,
+)
 from app.api.game_schemas import (
     CastSpellRequest,
     ClearUnitsResponse,
@@ -21,7 +27,7 @@ from app.api.game_schemas import (
     UpdateUnitStateRequest,
 )
 from app.api.games.common import unit_response_with_effective_caster
-from app.api.websocket import broadcast_to_game
+from app.api.websocket import schedule_broadcast
 from app.army_forge.parse import parse_special_rules
 from app.models import (
     DeploymentStatus,
@@ -55,18 +61,11 @@ class GamesUnitsStateController(Controller):
         session: AsyncSession,
     ) -> UnitResponse:
         """Update a unit's game state."""
-        game = await get_game_by_code(session, code, load_attached_heroes=True)
+        game = await get_game_row(session, code)
+        game_id, is_solo = game.id, game.is_solo
         game.last_activity_at = datetime.now(timezone.utc)
 
-        unit = None
-        for player in game.players:
-            for u in player.units:
-                if u.id == unit_id:
-                    unit = u
-                    break
-
-        if not unit:
-            raise NotFoundException(f"Unit {unit_id} not found in game")
+        unit = await get_unit_in_game(session, game_id, unit_id, load_attached_heroes=True)
 
         if not unit.state:
             raise ValidationException("Unit has no state (not initialized)")
@@ -77,20 +76,19 @@ class GamesUnitsStateController(Controller):
             raise ValidationException(detail=str(e)) from e
 
         await session.commit()
-        await session.refresh(unit)
+        unit = await get_unit_in_game(session, game_id, unit_id)
 
-        game = await get_game_by_code(session, code)
-        await broadcast_if_not_solo(
-            game,
-            code,
-            {
-                "type": "state_update",
-                "data": {
-                    "reason": "unit_updated",
-                    "unit_id": str(unit_id),
+        if not is_solo:
+            schedule_broadcast(
+                code,
+                {
+                    "type": "state_update",
+                    "data": {
+                        "reason": "unit_updated",
+                        "unit_id": str(unit_id),
+                    },
                 },
-            },
-        )
+            )
 
         return unit_response_with_effective_caster(unit)
     
@@ -218,6 +216,7 @@ class GamesUnitsStateController(Controller):
         unit_id = unit.id
         game_id = game.id
         game_round = game.current_round
+        is_solo = game.is_solo
         state_id = state.id  # Get ID right after flush, before commit
         
         # Update player stats
@@ -231,7 +230,7 @@ class GamesUnitsStateController(Controller):
         player_name = player.name  # Cache player.name as well
         
         # Create event directly to avoid accessing game/player objects in log_event
-        event = GameEvent.create(
+        event = GameEvent(
             game_id=game_id,
             event_type=EventType.CUSTOM,
             description=f"{player_name} added unit: {display_name} ({data.cost}pts)",
@@ -289,11 +288,8 @@ class GamesUnitsStateController(Controller):
             state=unit_state_response,
         )
         
-        # Reload game to get is_solo flag
-        game = await get_game_by_code(session, code)
-        
         # Broadcast state update - skip for solo games
-        await broadcast_if_not_solo(game, code, {
+        broadcast_if_not_solo(is_solo, code, {
             "type": "state_update",
             "data": {
                 "reason": "unit_created",
@@ -312,29 +308,26 @@ class GamesUnitsStateController(Controller):
         session: AsyncSession,
     ) -> ClearUnitsResponse:
         """Clear all units for a player (only allowed in lobby)."""
-        game = await get_game_by_code(session, code, load_attached_heroes=True)
+        game = await get_game_row(session, code)
         
         # Only allow in lobby status
         if game.status != GameStatus.LOBBY:
             raise ValidationException("Units can only be cleared in the lobby")
         
         # Find the player
-        player = None
-        for p in game.players:
-            if p.id == player_id:
-                player = p
-                break
-        
+        player_result = await session.execute(
+            select(Player).where(Player.id == player_id).where(Player.game_id == game.id)
+        )
+        player = player_result.scalar_one_or_none()
         if not player:
             raise NotFoundException(f"Player {player_id} not found in game")
         
-        # Query all units for this player
-        units_stmt = select(Unit).where(Unit.player_id == player_id)
-        units_result = await session.execute(units_stmt)
-        units = units_result.scalars().all()
-        
-        units_count = len(units)
-        total_points = sum(unit.cost for unit in units)
+        # Count/sum in SQL; the rows themselves are never needed
+        totals = await session.execute(
+            select(func.count(Unit.id), func.coalesce(func.sum(Unit.cost), 0))
+            .where(Unit.player_id == player_id)
+        )
+        units_count, total_points = totals.one()
         
         # Cache values before deletion to avoid accessing expired objects
         player_name = player.name
@@ -342,10 +335,15 @@ class GamesUnitsStateController(Controller):
         game_id = game.id
         game_code = game.code
         game_round = game.current_round
+        is_solo = game.is_solo
         
-        # Delete all units (cascade will handle UnitState deletion)
-        for unit in units:
-            await session.delete(unit)
+        # Two set-based DELETEs instead of one per unit. States go first so this
+        # does not depend on the database enforcing ON DELETE CASCADE.
+        player_unit_ids = select(Unit.id).where(Unit.player_id == player_id)
+        await session.execute(
+            sql_delete(UnitState).where(UnitState.unit_id.in_(player_unit_ids))
+        )
+        await session.execute(sql_delete(Unit).where(Unit.player_id == player_id))
         
         # Reset player stats and army book data
         player.starting_unit_count = 0
@@ -358,7 +356,7 @@ class GamesUnitsStateController(Controller):
         player.army_book_version = None
         
         # Log the clear action
-        event = GameEvent.create(
+        event = GameEvent(
             game_id=game_id,
             event_type=EventType.CUSTOM,
             description=f"{player_name} cleared all units ({units_count} units, {total_points}pts)",
@@ -373,11 +371,8 @@ class GamesUnitsStateController(Controller):
         
         await session.commit()
         
-        # Reload game to get is_solo flag
-        game = await get_game_by_code(session, game_code)
-        
         # Broadcast state update - skip for solo games
-        await broadcast_if_not_solo(game, game_code, {
+        broadcast_if_not_solo(is_solo, game_code, {
             "type": "state_update",
             "data": {
                 "reason": "units_cleared",
@@ -399,31 +394,19 @@ class GamesUnitsStateController(Controller):
         session: AsyncSession,
     ) -> UnitResponse:
         """Detach a hero unit from its parent unit."""
-        game = await get_game_by_code(session, code, load_attached_heroes=True)
-        
-        # Find the unit
-        unit = None
-        for player in game.players:
-            for u in player.units:
-                if u.id == unit_id:
-                    unit = u
-                    break
-        
-        if not unit:
-            raise NotFoundException(f"Unit {unit_id} not found in game")
+        game = await get_game_row(session, code)
+        is_solo = game.is_solo
+        unit = await get_unit_in_game(session, game.id, unit_id)
         
         if not unit.attached_to_unit_id:
             raise ValidationException(f"{unit.display_name} is not attached to any unit")
         
-        # Find parent unit for logging
-        parent_unit = None
-        for player in game.players:
-            for u in player.units:
-                if u.id == unit.attached_to_unit_id:
-                    parent_unit = u
-                    break
-        
-        parent_name = parent_unit.display_name if parent_unit else "unknown unit"
+        # Parent name for logging
+        result = await session.execute(
+            select(Unit.custom_name, Unit.name).where(Unit.id == unit.attached_to_unit_id)
+        )
+        parent = result.first()
+        parent_name = (parent.custom_name or parent.name) if parent else "unknown unit"
         
         # Detach the unit
         unit.attached_to_unit_id = None
@@ -436,20 +419,19 @@ class GamesUnitsStateController(Controller):
             target_unit_id=unit.id,
         )
         
+        game_id = game.id
         await session.commit()
-        await session.refresh(unit)
-        
-        # Reload game to get is_solo flag
-        game = await get_game_by_code(session, code)
+        unit = await get_unit_in_game(session, game_id, unit_id)
         
         # Broadcast state update - skip for solo games
-        await broadcast_if_not_solo(game, code, {
-            "type": "state_update",
-            "data": {
-                "reason": "unit_detached",
-                "unit_id": str(unit_id),
-            }
-        })
+        if not is_solo:
+            schedule_broadcast(code, {
+                "type": "state_update",
+                "data": {
+                    "reason": "unit_detached",
+                    "unit_id": str(unit_id),
+                }
+            })
         
         return unit_response_with_effective_caster(unit)
     
@@ -499,7 +481,7 @@ class GamesUnitsStateController(Controller):
             unit_player.starting_unit_count = max(0, (unit_player.starting_unit_count or 0) - 1)
             unit_player.starting_points = max(0, (unit_player.starting_points or 0) - unit_cost)
         
-        event = GameEvent.create(
+        event = GameEvent(
             game_id=game_id,
             event_type=EventType.CUSTOM,
             description=f"{player_name} removed unit: {display_name} ({unit_cost}pts)",
@@ -516,7 +498,7 @@ class GamesUnitsStateController(Controller):
         await session.commit()
         
         if not is_solo:
-            await broadcast_to_game(code, {
+            schedule_broadcast(code, {
                 "type": "state_update",
                 "data": {"reason": "unit_deleted", "unit_id": str(cached_unit_id)},
             })
@@ -549,12 +531,11 @@ class GamesUnitsStateController(Controller):
             stripped = data.custom_name.strip()
             unit.custom_name = stripped if stripped else None
         
+        is_solo = game.is_solo
         await session.commit()
         await session.refresh(unit)
         
-        game = await get_game_by_code(session, code)
-        
-        await broadcast_if_not_solo(game, code, {
+        broadcast_if_not_solo(is_solo, code, {
             "type": "state_update",
             "data": {"reason": "unit_updated", "unit_id": str(unit_id)},
         })
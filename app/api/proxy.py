@@ -2,12 +2,13 @@
 
 import logging
 
-import httpx
 from litestar import Controller, get, post
-from litestar.exceptions import HTTPException
+from litestar.exceptions import HTTPException, ValidationException
 
-from app.army_forge.client import fetch_json_get, tts_url
+from app.army_forge.client import tts_url
+from app.army_forge.import_fetch import fetch_army_list
 from app.army_forge.import_service import import_army_into_game
+from app.army_forge.parse import extract_list_id
 from app.army_forge.schemas import ArmyForgeListResponse, ImportArmyRequest, ImportArmyResponse
 from app.utils.rate_limit import check_rate_limit
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,15 +28,9 @@ class ProxyController(Controller):
         logger.info("Fetching Army Forge list: %s", list_id)
         logger.debug("Army Forge URL: %s", tts_url(list_id))
 
-        async with httpx.AsyncClient() as client:
-            data = await fetch_json_get(
-                client,
-                tts_url(list_id),
-                timeout=15.0,
-                not_found_detail=f"Army list '{list_id}' not found on Army Forge",
-            )
-            logger.info("Successfully fetched list %s: %s units", list_id, len(data.get("units", [])))
-            return ArmyForgeListResponse(**data)
+        data = await fetch_army_list(list_id, logger)
+        logger.info("Successfully fetched list %s: %s units", list_id, len(data.get("units", [])))
+        return ArmyForgeListResponse.model_validate(data)
 
     @post("/import-army/{game_code:str}")
     async def import_army(
@@ -45,13 +40,20 @@ class ProxyController(Controller):
         session: AsyncSession,
     ) -> ImportArmyResponse:
         """Import an army from Army Forge into a game."""
-        if not check_rate_limit(f"import_army:{game_code.upper()}", max_requests=10, window_sec=60):
+        game_code = game_code.upper()
+        if not check_rate_limit(f"import_army:{game_code}", max_requests=10, window_sec=60):
             raise HTTPException(status_code=429, detail="Too many import requests. Please try again in a minute.")
         logger.info("Import army request for game %s, player %s", game_code, data.player_id)
         logger.debug("Army Forge URL/ID: %s", data.army_forge_url)
+        # Reject malformed URLs before the service does any DB work
+        try:
+            list_id = extract_list_id(data.army_forge_url)
+        except ValidationException:
+            logger.error("Failed to extract list ID from: %s", data.army_forge_url)
+            raise
         return await import_army_into_game(
             session,
             game_code,
             data.player_id,
-            data.army_forge_url,
+            list_id,
         )
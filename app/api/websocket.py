@@ -1,71 +1,126 @@
 """WebSocket handler for real-time game synchronization."""
 
+import asyncio
 import json
+import time
 import uuid
 import logging
-from typing import Dict, Optional, Any, Set
+from collections import OrderedDict
+from typing import Coroutine, Dict, Hashable, Iterable, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass, field
 
 from litestar import WebSocket, websocket
 from litestar.exceptions import WebSocketDisconnect
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from litestar.serialization import encode_json
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, raiseload, selectinload
 
-from app.models import Game, Player, GameEvent, EventType
+from app.api.game_schemas import GameStateView, ObjectiveView, PlayerView, UnitStateView, UnitView
+from app.models import Game, Player, Unit, GameEvent, EventType
 from app.utils.logging import error_log, log_exception_with_context
 from app.utils.unit_stats import get_effective_caster
 
 logger = logging.getLogger("Herald.WebSocket")
 
 
+def encode_message(message: Union[dict, str]) -> str:
+    """
+    Encode an outbound message to a JSON text frame.
+    
+    Uses Litestar's msgspec encoder (UUIDs, datetimes and enums are handled
+    natively); strings are assumed to be pre-encoded and pass through.
+    """
+    if isinstance(message, str):
+        return message
+    return encode_json(message).decode()
+
+
+# Relay window for client "state_update" messages (~60Hz); see queue_state_update
+STATE_UPDATE_INTERVAL = 0.016
+# A send slower than this means the peer is not reading; see GameRoom.broadcast
+SEND_TIMEOUT_SECONDS = 5.0
+
+
 @dataclass
 class GameRoom:
     """Tracks connected clients for a game."""
     game_code: str
     connections: Dict[uuid.UUID, WebSocket] = field(default_factory=dict)  # player_id -> websocket
     anonymous_connections: Set[WebSocket] = field(default_factory=set)  # Connections before "join" message
+    # sender -> latest relayed "state_update" data, flushed by _flush_state_updates
+    pending_state_updates: Dict[Optional[uuid.UUID], Any] = field(default_factory=dict, init=False, repr=False)
+    _state_update_flush: Optional[asyncio.TimerHandle] = field(default=None, init=False, repr=False)
     
-    async def broadcast(self, message: dict, exclude: Optional[uuid.UUID] = None) -> None:
-        """Send message to all connected clients except excluded one."""
-        disconnected = []
-        disconnected_anon = []
+    async def broadcast(self, message: Union[dict, str], exclude: Optional[uuid.UUID] = None) -> None:
+        """
+        Send message to all connected clients except excluded one.
         
-        # Send to identified connections
-        for player_id, ws in self.connections.items():
-            if player_id != exclude:
-                try:
-                    await ws.send_json(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send to player {player_id}: {e}")
-                    disconnected.append(player_id)
-        
-        # Send to anonymous connections too
-        for ws in self.anonymous_connections:
-            try:
-                await ws.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to send to anonymous connection: {e}")
-                disconnected_anon.append(ws)
+        The message is encoded to JSON once and the same text frame is sent to
+        every subscriber; callers may also pass an already-encoded JSON string.
+        Sends run concurrently, so one slow client does not hold up the room.
+        A peer that cannot take a frame within ``SEND_TIMEOUT_SECONDS`` is
+        dropped and its socket closed, so the client reconnects and resyncs.
+        """
+        payload = encode_message(message)
+        if exclude is None:
+            targets = list(self.connections.items())
+        else:
+            targets = [(pid, ws) for pid, ws in self.connections.items() if pid != exclude]
+        targets.extend((None, ws) for ws in self.anonymous_connections)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_text(payload), SEND_TIMEOUT_SECONDS) for _, ws in targets),
+            return_exceptions=True,
+        )
         
         # Clean up disconnected clients
-        for player_id in disconnected:
-            self.connections.pop(player_id, None)
-        for ws in disconnected_anon:
-            self.anonymous_connections.discard(ws)
+        for (player_id, ws), result in zip(targets, results):
+            if not isinstance(result, Exception):
+                continue
+            if isinstance(result, TimeoutError):
+                # Still connected but not draining; close so it reconnects
+                _run_in_background(ws.close(code=1013, reason="Too slow"))
+            if player_id is None:
+                logger.warning("Failed to send to anonymous connection: %s", result)
+                self.anonymous_connections.discard(ws)
+            else:
+                logger.warning("Failed to send to player %s: %s", player_id, result)
+                self.connections.pop(player_id, None)
     
-    async def send_to(self, player_id: uuid.UUID, message: dict) -> bool:
+    async def send_to(self, player_id: uuid.UUID, message: Union[dict, str]) -> bool:
         """Send message to a specific player."""
         ws = self.connections.get(player_id)
         if ws:
             try:
-                await ws.send_json(message)
+                await ws.send_text(encode_message(message))
                 return True
             except Exception as e:
-                logger.warning(f"Failed to send to player {player_id}: {e}")
+                logger.warning("Failed to send to player %s: %s", player_id, e)
                 self.connections.pop(player_id, None)
         return False
     
+    def queue_state_update(self, sender: Optional[uuid.UUID], data: Any) -> None:
+        """
+        Relay a client's ``state_update`` to the rest of the room, coalesced.
+        
+        Only the latest update per sender within ``STATE_UPDATE_INTERVAL`` is
+        sent; receivers refetch the game on any ``state_update``, so dropping
+        intermediate payloads (e.g. during a drag) loses nothing.
+        """
+        self.pending_state_updates[sender] = data
+        if self._state_update_flush is None:
+            self._state_update_flush = asyncio.get_running_loop().call_later(
+                STATE_UPDATE_INTERVAL, self._flush_state_updates
+            )
+    
+    def _flush_state_updates(self) -> None:
+        self._state_update_flush = None
+        pending, self.pending_state_updates = self.pending_state_updates, {}
+        for sender, data in pending.items():
+            _run_in_background(
+                self.broadcast({"type": "state_update", "data": data}, exclude=sender)
+            )
+    
     def add_anonymous_connection(self, ws: WebSocket) -> None:
         """Add an anonymous connection (before player identifies)."""
         self.anonymous_connections.add(ws)
@@ -97,6 +152,16 @@ class GameRoomManager:
     
     def __init__(self):
         self._rooms: Dict[str, GameRoom] = {}
+        # Encoded {"type": "state"} frames per game code. A committed write
+        # drops the frames of the games it touched (see _drop_cached_states).
+        self._state_frames: Dict[str, str] = {}
+        # Frames are stamped with the generation their read started at and
+        # only stored if no invalidation of that game (or of all games) came
+        # later. Stamps are kept for games with a room: only sockets in a room
+        # read frames, and a room is not removed while one is connected.
+        self.state_generation = 0
+        self._invalidated_at: Dict[str, int] = {}
+        self._all_invalidated_at = 0
     
     def get_room(self, game_code: str) -> GameRoom:
         """Get or create a room for a game."""
@@ -107,7 +172,37 @@ class GameRoomManager:
     
     def remove_room(self, game_code: str) -> None:
         """Remove a room when game ends."""
-        self._rooms.pop(game_code.upper(), None)
+        code = game_code.upper()
+        self._rooms.pop(code, None)
+        self._state_frames.pop(code, None)
+        self._invalidated_at.pop(code, None)
+    
+    def get_state_frame(self, game_code: str) -> Optional[str]:
+        """Return the cached state frame for an upper-case game code, if still valid."""
+        return self._state_frames.get(game_code)
+    
+    def store_state_frame(self, game_code: str, frame: str, generation: int) -> None:
+        """
+        Cache a state frame built from data read at ``generation``.
+        
+        ``game_code`` must already be upper-case. Frames read before a write
+        to that game committed are discarded rather than stored.
+        """
+        if generation >= max(self._all_invalidated_at, self._invalidated_at.get(game_code, 0)):
+            self._state_frames[game_code] = frame
+    
+    def invalidate_states(self, game_codes: Optional[Iterable[str]] = None) -> None:
+        """Drop the cached state frames of ``game_codes`` (upper-case), or of every game."""
+        self.state_generation += 1
+        if game_codes is None:
+            self._all_invalidated_at = self.state_generation
+            self._invalidated_at.clear()
+            self._state_frames.clear()
+            return
+        for code in game_codes:
+            if code in self._rooms:
+                self._invalidated_at[code] = self.state_generation
+            self._state_frames.pop(code, None)
     
     def get_all_rooms(self) -> Dict[str, GameRoom]:
         """Get all active rooms."""
@@ -117,29 +212,242 @@ class GameRoomManager:
 # Global room manager instance
 room_manager = GameRoomManager()
 
+_STATE_WRITE_KEY = "herald_state_write"
+_STATE_CODES_KEY = "herald_state_codes"
+
 
-async def broadcast_to_game(game_code: str, message: dict, exclude_player_id: Optional[uuid.UUID] = None) -> None:
+def note_game_code(session: Union[Session, AsyncSession], code: str) -> None:
+    """
+    Record that ``session`` works on the game with this upper-case code.
+    
+    Commits with writes then drop only these games' cached state frames; a
+    session that wrote without noting any game drops them all.
+    """
+    session.info.setdefault(_STATE_CODES_KEY, set()).add(code)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flush(session: Session, flush_context: Any) -> None:
+    session.info[_STATE_WRITE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_write_statement(orm_execute_state: Any) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_STATE_WRITE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_cached_states(session: Session) -> None:
+    if session.info.pop(_STATE_WRITE_KEY, False):
+        room_manager.invalidate_states(session.info.get(_STATE_CODES_KEY))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session: Session) -> None:
+    session.info.pop(_STATE_WRITE_KEY, None)
+
+
+async def broadcast_to_game(
+    game_code: str,
+    message: Union[dict, str],
+    exclude_player_id: Optional[uuid.UUID] = None,
+) -> None:
     """
     Broadcast a message to all connected clients in a game room.
     
     This can be called from REST API handlers to notify WebSocket clients
-    of changes (e.g., player joined, game started, etc.)
+    of changes (e.g., player joined, game started, etc.). ``message`` may be a
+    dict or a pre-encoded JSON string; either way it is encoded at most once.
     """
     room = room_manager.get_room(game_code)
     if room.connection_count > 0:
         await room.broadcast(message, exclude=exclude_player_id)
-        logger.debug(f"Broadcast to game {game_code}: {message.get('type')}")
+        logger.debug(
+            "Broadcast to game %s: %s",
+            game_code,
+            message.get("type") if isinstance(message, dict) else "raw",
+        )
+
+
+# Coalescing window for bursty updates (e.g. repeated +VP clicks)
+BROADCAST_DEBOUNCE_SECONDS = 0.05
+
+_pending_broadcasts: Dict[Tuple[str, Hashable], asyncio.TimerHandle] = {}
+# Strong references to in-flight broadcast tasks so they are not GC'd mid-send
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_broadcast_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background broadcast failed: %r", task.exception())
+
 
+def _run_in_background(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Run a broadcast coroutine as a tracked task whose failure is logged."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_broadcast_done)
+    return task
+
+
+def schedule_broadcast(
+    game_code: str,
+    message: Union[dict, str],
+    exclude_player_id: Optional[uuid.UUID] = None,
+) -> asyncio.Task:
+    """
+    Fire-and-forget ``broadcast_to_game``.
+    
+    REST handlers call this after commit so the HTTP response does not wait
+    on the websocket fan-out. Failures are logged, not raised.
+    """
+    return _run_in_background(
+        broadcast_to_game(game_code, message, exclude_player_id=exclude_player_id)
+    )
 
-async def get_game_state(session: AsyncSession, code: str) -> Optional[dict]:
-    """Fetch full game state for broadcasting."""
+
+def debounce_broadcast(
+    game_code: str,
+    message: Union[dict, str],
+    key: Hashable,
+    delay: float = BROADCAST_DEBOUNCE_SECONDS,
+) -> None:
+    """
+    Broadcast ``message`` after ``delay`` seconds unless superseded.
+    
+    Calls sharing ``(game_code, key)`` within the window replace each other, so
+    subscribers only receive the latest payload. Must be called from the
+    event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pending_key = (game_code.upper(), key)
+    handle = _pending_broadcasts.pop(pending_key, None)
+    if handle:
+        handle.cancel()
+    
+    def flush() -> None:
+        _pending_broadcasts.pop(pending_key, None)
+        schedule_broadcast(game_code, message)
+    
+    _pending_broadcasts[pending_key] = loop.call_later(delay, flush)
+
+
+# Coalescing window for player is_connected=False writes (reconnect churn).
+# Connects are written in the join's own commit: peers refetch the game as
+# soon as player_joined arrives and must already see the flag set.
+CONNECTION_FLUSH_SECONDS = 0.5
+
+# engine -> player_id -> upper-case game code
+_pending_disconnects: Dict[AsyncEngine, Dict[uuid.UUID, str]] = {}
+_connection_flush: Optional[asyncio.TimerHandle] = None
+
+
+def queue_disconnect(engine: AsyncEngine, game_code: str, player_id: uuid.UUID) -> None:
+    """
+    Record a player's disconnect for the next batched ``is_connected`` write.
+    
+    Disconnects inside one window collapse into a single UPDATE per engine,
+    written by ``flush_connection_status`` on its own session so the socket
+    teardown does not wait on the commit. Must be called from the event loop.
+    """
+    global _connection_flush
+    _pending_disconnects.setdefault(engine, {})[player_id] = game_code
+    if _connection_flush is None:
+        _connection_flush = asyncio.get_running_loop().call_later(
+            CONNECTION_FLUSH_SECONDS, _start_connection_flush
+        )
+
+
+def cancel_disconnect(player_id: uuid.UUID) -> None:
+    """Drop a queued disconnect (the player reconnected before the flush)."""
+    for players in _pending_disconnects.values():
+        players.pop(player_id, None)
+
+
+def _start_connection_flush() -> None:
+    global _connection_flush
+    _connection_flush = None
+    task = asyncio.get_running_loop().create_task(flush_connection_status())
+    _background_tasks.add(task)
+    task.add_done_callback(_on_connection_flush_done)
+
+
+def _on_connection_flush_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Connection status flush failed: %r", task.exception())
+
+
+async def flush_connection_status() -> None:
+    """Write queued disconnects (also the Litestar on_shutdown hook)."""
+    global _connection_flush
+    if _connection_flush is not None:
+        _connection_flush.cancel()
+        _connection_flush = None
+    pending = dict(_pending_disconnects)
+    _pending_disconnects.clear()
+    for engine, players in pending.items():
+        if not players:
+            continue
+        async with AsyncSession(engine) as session:
+            for code in set(players.values()):
+                note_game_code(session, code)
+            await session.execute(
+                Player.__table__.update()
+                .where(Player.id.in_(list(players)))
+                .values(is_connected=False)
+            )
+            await session.commit()
+
+
+# player_id -> (cached_at, (id, name, color) row) for repeated "join" messages.
+# Short TTL because loading a save can rename or recolor players.
+JOIN_CACHE_TTL = 60.0
+JOIN_CACHE_SIZE = 4096
+_join_cache: "OrderedDict[uuid.UUID, Tuple[float, Any]]" = OrderedDict()
+
+
+async def lookup_joining_player(session: AsyncSession, player_id: uuid.UUID) -> Optional[Any]:
+    """Return the player's ``(id, name, color)`` row, or None if there is no such player."""
+    entry = _join_cache.get(player_id)
+    if entry is not None and time.monotonic() - entry[0] <= JOIN_CACHE_TTL:
+        _join_cache.move_to_end(player_id)
+        return entry[1]
+    result = await session.execute(
+        select(Player.id, Player.name, Player.color).where(Player.id == player_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    _join_cache[player_id] = (time.monotonic(), row)
+    _join_cache.move_to_end(player_id)
+    if len(_join_cache) > JOIN_CACHE_SIZE:
+        _join_cache.popitem(last=False)
+    return row
+
+
+async def get_game_state(session: AsyncSession, code: str) -> Optional[GameStateView]:
+    """
+    Fetch full game state for an upper-case game code.
+    
+    Returns msgspec Structs that ``encode_message`` writes in a single pass
+    (UUIDs and enums in their canonical JSON form).
+    """
     stmt = (
         select(Game)
-        .where(Game.code == code.upper())
+        .where(Game.code == code)
         .options(
-            selectinload(Game.players).selectinload(Player.units),
+            selectinload(Game.players).selectinload(Player.units).selectinload(Unit.state),
             selectinload(Game.objectives),
+            # Everything the state dict reads is loaded above; fail loudly
+            # instead of lazy-loading per unit.
+            raiseload("*", sql_only=True),
         )
+        # The websocket session lives as long as the connection; refresh rows it
+        # already holds so the state (and the shared frame cache) is current.
+        .execution_options(populate_existing=True)
     )
     result = await session.execute(stmt)
     game = result.scalar_one_or_none()
@@ -147,97 +455,110 @@ async def get_game_state(session: AsyncSession, code: str) -> Optional[dict]:
     if not game:
         return None
     
-    # Build state dict
     players = []
     units = []
     
     for player in game.players:
-        players.append({
-            "id": str(player.id),
-            "name": player.name,
-            "color": player.color,
-            "is_host": player.is_host,
-            "is_connected": player.is_connected,
-            "army_name": player.army_name,
-            "army_forge_list_id": player.army_forge_list_id,
-            "starting_unit_count": player.starting_unit_count,
-            "starting_points": player.starting_points,
-            "has_finished_activations": player.has_finished_activations,
-            "spells": player.spells,
-            "special_rules": player.special_rules,
-            "faction_name": player.faction_name,
-            "army_book_version": player.army_book_version,
-            "victory_points": player.victory_points,
-        })
+        players.append(PlayerView(
+            id=player.id,
+            name=player.name,
+            color=player.color,
+            is_host=player.is_host,
+            is_connected=player.is_connected,
+            army_name=player.army_name,
+            army_forge_list_id=player.army_forge_list_id,
+            starting_unit_count=player.starting_unit_count,
+            starting_points=player.starting_points,
+            has_finished_activations=player.has_finished_activations,
+            spells=player.spells,
+            special_rules=player.special_rules,
+            faction_name=player.faction_name,
+            army_book_version=player.army_book_version,
+            victory_points=player.victory_points,
+        ))
         
         for unit in player.units:
-            unit_dict = {
-                "id": str(unit.id),
-                "player_id": str(unit.player_id),
-                "name": unit.name,
-                "custom_name": unit.custom_name,
-                "quality": unit.quality,
-                "defense": unit.defense,
-                "size": unit.size,
-                "tough": unit.tough,
-                "cost": unit.cost,
-                "loadout": unit.loadout,
-                "rules": unit.rules,
-                "is_hero": unit.is_hero,
-                "is_caster": (ec := get_effective_caster(unit))[0],
-                "caster_level": (ec[1] or unit.caster_level) if ec[0] else unit.caster_level,
-                "is_transport": unit.is_transport,
-                "transport_capacity": unit.transport_capacity,
-                "has_ambush": unit.has_ambush,
-                "has_scout": unit.has_scout,
-                "attached_to_unit_id": str(unit.attached_to_unit_id) if unit.attached_to_unit_id else None,
-                "upgrades": unit.upgrades,
-            }
-            
-            if unit.state:
-                unit_dict["state"] = {
-                    "id": str(unit.state.id),
-                    "wounds_taken": unit.state.wounds_taken,
-                    "models_remaining": unit.state.models_remaining,
-                    "activated_this_round": unit.state.activated_this_round,
-                    "is_shaken": unit.state.is_shaken,
-                    "is_fatigued": unit.state.is_fatigued,
-                    "deployment_status": unit.state.deployment_status.value,
-                    "transport_id": str(unit.state.transport_id) if unit.state.transport_id else None,
-                    "spell_tokens": unit.state.spell_tokens,
-                    "limited_weapons_used": unit.state.limited_weapons_used,
-                    "custom_notes": unit.state.custom_notes,
-                }
-            else:
-                unit_dict["state"] = None
-            
-            units.append(unit_dict)
+            state = unit.state
+            is_caster, caster_level = get_effective_caster(unit)
+            units.append(UnitView(
+                id=unit.id,
+                player_id=unit.player_id,
+                name=unit.name,
+                custom_name=unit.custom_name,
+                quality=unit.quality,
+                defense=unit.defense,
+                size=unit.size,
+                tough=unit.tough,
+                cost=unit.cost,
+                loadout=unit.loadout,
+                rules=unit.rules,
+                is_hero=unit.is_hero,
+                is_caster=is_caster,
+                caster_level=(caster_level or unit.caster_level) if is_caster else unit.caster_level,
+                is_transport=unit.is_transport,
+                transport_capacity=unit.transport_capacity,
+                has_ambush=unit.has_ambush,
+                has_scout=unit.has_scout,
+                attached_to_unit_id=unit.attached_to_unit_id,
+                upgrades=unit.upgrades,
+                state=UnitStateView(
+                    id=state.id,
+                    wounds_taken=state.wounds_taken,
+                    models_remaining=state.models_remaining,
+                    activated_this_round=state.activated_this_round,
+                    is_shaken=state.is_shaken,
+                    is_fatigued=state.is_fatigued,
+                    deployment_status=state.deployment_status,
+                    transport_id=state.transport_id,
+                    spell_tokens=state.spell_tokens,
+                    limited_weapons_used=state.limited_weapons_used,
+                    custom_notes=state.custom_notes,
+                ) if state else None,
+            ))
     
     objectives = [
-        {
-            "id": str(obj.id),
-            "marker_number": obj.marker_number,
-            "label": obj.label,
-            "status": obj.status.value,
-            "controlled_by_id": str(obj.controlled_by_id) if obj.controlled_by_id else None,
-        }
+        ObjectiveView(
+            id=obj.id,
+            marker_number=obj.marker_number,
+            label=obj.label,
+            status=obj.status,
+            controlled_by_id=obj.controlled_by_id,
+        )
         for obj in game.objectives
     ]
     
-    return {
-        "id": str(game.id),
-        "code": game.code,
-        "name": game.name,
-        "game_system": game.game_system.value,
-        "status": game.status.value,
-        "current_round": game.current_round,
-        "max_rounds": game.max_rounds,
-        "current_player_id": str(game.current_player_id) if game.current_player_id else None,
-        "first_player_next_round_id": str(game.first_player_next_round_id) if game.first_player_next_round_id else None,
-        "players": players,
-        "units": units,
-        "objectives": objectives,
-    }
+    return GameStateView(
+        id=game.id,
+        code=game.code,
+        name=game.name,
+        game_system=game.game_system,
+        status=game.status,
+        current_round=game.current_round,
+        max_rounds=game.max_rounds,
+        current_player_id=game.current_player_id,
+        first_player_next_round_id=game.first_player_next_round_id,
+        players=players,
+        units=units,
+        objectives=objectives,
+    )
+
+
+async def get_state_frame(session: AsyncSession, code: str) -> Optional[str]:
+    """
+    Return the encoded ``{"type": "state"}`` frame for an upper-case game code.
+    
+    Served from the room manager's cache until a write commits; reconnect
+    bursts and ``request_state`` then skip the query and the re-encode.
+    """
+    frame = room_manager.get_state_frame(code)
+    if frame is None:
+        generation = room_manager.state_generation
+        game_state = await get_game_state(session, code)
+        if not game_state:
+            return None
+        frame = encode_message({"type": "state", "data": game_state})
+        room_manager.store_state_frame(code, frame, generation)
+    return frame
 
 
 @websocket("/ws/game/{code:str}")
@@ -245,6 +566,7 @@ async def game_websocket(
     socket: WebSocket,
     code: str,
     session: AsyncSession,
+    db_engine: AsyncEngine,
 ) -> None:
     """
     WebSocket endpoint for game synchronization.
@@ -275,12 +597,15 @@ async def game_websocket(
     - {"type": "pong"}
     - {"type": "error", "message": "..."}
     """
+    # Canonical (upper-case) code from here on; internals do not re-normalize
+    code = code.upper()
+    
     # Check if game is in solo mode - skip WebSocket for solo games
     from app.api.game_helpers import get_game_by_code
     game = await get_game_by_code(session, code)
     if game.is_solo:
         await socket.close(code=1008, reason="Solo games do not use WebSocket")
-        logger.info(f"WebSocket connection rejected for solo game {code}")
+        logger.info("WebSocket connection rejected for solo game %s", code)
         return
     
     await socket.accept()
@@ -293,17 +618,17 @@ async def game_websocket(
     # the 2 player slots (multiplayer) or 1 slot (solo). Only clients that send "join" with
     # a valid player_id are moved to room.connections and affect is_connected / player list.
     room.add_anonymous_connection(socket)
-    logger.info(f"WebSocket connected to game {code} (anonymous)")
+    logger.info("WebSocket connected to game %s (anonymous)", code)
     
     try:
         # Send initial game state
-        game_state = await get_game_state(session, code)
-        if not game_state:
+        state_frame = await get_state_frame(session, code)
+        if not state_frame:
             await socket.send_json({"type": "error", "message": f"Game '{code}' not found"})
             await socket.close()
             return
         
-        await socket.send_json({"type": "state", "data": game_state})
+        await socket.send_text(state_frame)
         
         # Main message loop
         while True:
@@ -321,17 +646,15 @@ async def game_websocket(
                     player_id = uuid.UUID(data.get("player_id"))
                     room.add_connection(player_id, socket)
                     
-                    # Update player connection status in DB without lazy loads
-                    stmt = select(Player.id, Player.name, Player.color).where(Player.id == player_id)
-                    result = await session.execute(stmt)
-                    row = result.first()
+                    row = await lookup_joining_player(session, player_id)
                     
                     if row:
                         # Mark connected and update game activity
                         from datetime import datetime, timezone
                         from app.models import Game
                         
-                        # Update player connection status
+                        # A reconnect inside the flush window must not be undone
+                        cancel_disconnect(player_id)
                         await session.execute(
                             Player.__table__.update()
                             .where(Player.id == player_id)
@@ -341,7 +664,7 @@ async def game_websocket(
                         # Update game activity tracking
                         await session.execute(
                             Game.__table__.update()
-                            .where(Game.code == code.upper())
+                            .where(Game.code == code)
                             .values(last_activity_at=datetime.now(timezone.utc))
                         )
                         
@@ -360,7 +683,7 @@ async def game_websocket(
                             exclude=player_id
                         )
                         
-                        logger.info(f"Player {row.name} joined game {code}")
+                        logger.info("Player %s joined game %s", row.name, code)
                     else:
                         await socket.send_json({"type": "error", "message": "Player not found"})
                 
@@ -372,27 +695,24 @@ async def game_websocket(
             
             elif msg_type == "request_state":
                 # Client requesting full state refresh
-                game_state = await get_game_state(session, code)
-                if game_state:
-                    await socket.send_json({"type": "state", "data": game_state})
+                state_frame = await get_state_frame(session, code)
+                if state_frame:
+                    await socket.send_text(state_frame)
             
             elif msg_type == "state_update":
                 # Generic state update - just broadcast to others
                 # The actual persistence is done via REST API
                 # This is for instant UI sync
-                await room.broadcast(
-                    {"type": "state_update", "data": data.get("data", {})},
-                    exclude=player_id
-                )
+                room.queue_state_update(player_id, data.get("data", {}))
             
             else:
                 await socket.send_json({"type": "error", "message": f"Unknown message type: {msg_type}"})
     
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for game {code}")
+        logger.info("WebSocket disconnected for game %s", code)
     
-    except Exception as e:  # pragma: no cover — belt-and-suspenders; message-loop errors surface via disconnect
-        logger.exception(f"WebSocket error for game {code}: {e}")
+    except Exception:  # pragma: no cover — belt-and-suspenders; message-loop errors surface via disconnect
+        logger.exception("WebSocket error for game %s", code)
     
     finally:
         # Clean up - remove from both anonymous and identified
@@ -401,20 +721,14 @@ async def game_websocket(
         if player_id:
             # Update player connection status
             try:
-                # Mark disconnected without lazy loads
-                await session.execute(
-                    Player.__table__.update()
-                    .where(Player.id == player_id)
-                    .values(is_connected=False)
-                )
-                await session.commit()
+                queue_disconnect(db_engine, code, player_id)
                 
                 # Notify others
                 await room.broadcast(
                     {"type": "player_left", "player_id": str(player_id)}
                 )
                 
-                logger.info(f"Player {player_id} left game {code}")
+                logger.info("Player %s left game %s", player_id, code)
             except Exception as e:  # pragma: no cover — defensive; DB pool teardown can mask with real drivers
                 error_log(
                     "Error updating player status on disconnect",
@@ -425,7 +739,7 @@ async def game_websocket(
                     }
                 )
         else:
-            logger.info(f"Anonymous WebSocket disconnected from game {code}")
+            logger.info("Anonymous WebSocket disconnected from game %s", code)
         
         # Remove empty rooms
         if room.connection_count == 0:
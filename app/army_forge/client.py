@@ -1,12 +1,56 @@
 """HTTP client helpers for Army Forge public API."""
 
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
 import httpx
+import msgspec
 from litestar.exceptions import NotFoundException, ValidationException
 
 from app.utils.logging import error_log
 
 BASE_URL = "https://army-forge.onepagerules.com"
 
+logger = logging.getLogger("Herald.army_forge")
+
+# Cap on simultaneous outbound GETs per process, so an import burst queues here
+# instead of tripping Army Forge's rate limiting.
+MAX_CONCURRENT_FETCHES = 8
+_fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+# One pooled client per process so repeat fetches reuse the TCP/TLS connection
+# to Army Forge instead of handshaking on every request. Closed on app shutdown.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared Army Forge client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # retries= only covers failed connects; see get_with_retry for the rest
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+            timeout=httpx.Timeout(15.0, connect=5.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (Litestar on_shutdown hook)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def tts_url(list_id: str) -> str:
     return f"{BASE_URL}/api/tts?id={list_id}"
@@ -20,18 +64,95 @@ def army_book_url(army_id: str, game_system: str) -> str:
     return f"{BASE_URL}/api/army-books/{army_id}?gameSystem={game_system}"
 
 
-async def fetch_json_get(
-    client: httpx.AsyncClient,
-    url: str,
-    *,
-    timeout: float = 15.0,
-    not_found_detail: str | None = None,
-) -> dict:
-    """GET JSON; map httpx errors to Litestar API exceptions."""
+def decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON body straight from the raw bytes (msgspec, much faster than stdlib
+    ``json`` on large lists/army books)."""
+    return msgspec.json.decode(response.content)
+
+
+# list_id -> (fetched_at, TTS JSON). Lists can be edited mid-session, so fresh
+# entries only live a few seconds by default; older ones are kept (LRU-bounded)
+# purely as a fallback when Army Forge is failing. Deployments where lists are
+# effectively frozen during play can raise the TTL.
+LIST_CACHE_TTL = float(os.getenv("ARMY_FORGE_LIST_CACHE_TTL", "10"))
+LIST_CACHE_SIZE = int(os.getenv("ARMY_FORGE_LIST_CACHE_SIZE", "256"))
+_list_cache: "OrderedDict[str, tuple[float, dict[str, Any]]]" = OrderedDict()
+
+
+def cached_list(list_id: str, max_age: float | None = LIST_CACHE_TTL) -> dict[str, Any] | None:
+    """Return a cached list no older than ``max_age`` seconds (any age if None)."""
+    entry = _list_cache.get(list_id)
+    if entry is None:
+        return None
+    fetched_at, data = entry
+    if max_age is not None and time.monotonic() - fetched_at > max_age:
+        return None
+    _list_cache.move_to_end(list_id)
+    return data
+
+
+def remember_list(list_id: str, data: dict[str, Any]) -> None:
+    """Cache a freshly fetched list (treat the cached dict as read-only)."""
+    _list_cache[list_id] = (time.monotonic(), data)
+    _list_cache.move_to_end(list_id)
+    if len(_list_cache) > LIST_CACHE_SIZE:
+        _list_cache.popitem(last=False)
+
+
+T = TypeVar("T")
+
+# key -> in-progress upstream fetch, so concurrent misses for the same list
+# share one request instead of each hitting Army Forge.
+_inflight: dict[str, "asyncio.Future[Any]"] = {}
+
+
+async def single_flight(key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Await ``fetch()``, joining an identical fetch already in flight for ``key``."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one caller disconnecting must not cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+# Gateway errors and timeouts from Army Forge are usually transient. 500 is
+# not retried: it is what Army Forge returns for private/custom lists.
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.3
+RETRY_MAX_DELAY = 2.0
+
+
+async def limited_get(client: httpx.AsyncClient, url: str, *, timeout: float) -> httpx.Response:
+    """Single GET, waiting for a free slot if MAX_CONCURRENT_FETCHES are in flight."""
+    if _fetch_slots.locked():
+        logger.info("Army Forge fetch slots busy, queueing %s", url)
+    async with _fetch_slots:
+        return await client.get(url, timeout=timeout)
+
+
+async def get_with_retry(client: httpx.AsyncClient, url: str, *, timeout: float) -> httpx.Response:
+    """GET ``url``, retrying gateway errors and timeouts with jittered exponential backoff."""
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            response = await limited_get(client, url, timeout=timeout)
+        except (httpx.TimeoutException, httpx.ConnectError):
+            if attempt == RETRY_ATTEMPTS:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                return response
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+
+@contextmanager
+def army_forge_errors(url: str, *, not_found_detail: str | None = None) -> Iterator[None]:
+    """Map httpx failures raised inside the block to Litestar API exceptions."""
     try:
-        response = await client.get(url, timeout=timeout)
-        response.raise_for_status()
-        return response.json()
+        yield
     except httpx.HTTPStatusError as e:
         error_log(
             "Army Forge HTTP error",
@@ -44,11 +165,6 @@ async def fetch_json_get(
         )
         if e.response.status_code == 404:
             raise NotFoundException(not_found_detail or "Army list not found on Army Forge") from e
-        if e.response.status_code == 500:
-            raise ValidationException(
-                "Army Forge returned an error for this list. If it uses custom or Studio army books, "
-                "check that the list and army are set to public in Army Forge Studio. Otherwise add units manually."
-            ) from e
         raise ValidationException(f"Army Forge API error: {e.response.status_code}") from e
     except httpx.TimeoutException as e:
         error_log("Army Forge request timed out", exc=e, context={"url": url})
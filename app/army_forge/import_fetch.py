@@ -4,9 +4,21 @@ import logging
 from typing import Any
 
 import httpx
-from litestar.exceptions import NotFoundException, ValidationException
+from litestar.exceptions import ValidationException
 
-from app.army_forge.client import army_book_url, share_url, tts_url
+from app.army_forge.client import (
+    army_book_url,
+    army_forge_errors,
+    decode_json,
+    cached_list,
+    get_http_client,
+    get_with_retry,
+    limited_get,
+    remember_list,
+    share_url,
+    single_flight,
+    tts_url,
+)
 from app.army_forge.parse import share_unit_to_tts
 
 
@@ -19,75 +31,92 @@ async def download_army_forge_list(
     Fetch TTS JSON for ``list_id``. On TTS HTTP 500, fall back to share API + army books
     (same client used for all follow-up GETs).
     """
+    log.info("Fetching Army Forge list: %s", list_id)
+    url = tts_url(list_id)
+    with army_forge_errors(url, not_found_detail=f"Army list '{list_id}' not found on Army Forge"):
+        response = await get_with_retry(client, url, timeout=15.0)
+        if response.status_code != 500:
+            response.raise_for_status()
+            data = decode_json(response)
+            log.debug("Army data received: %s units", len(data.get("units", [])))
+            return data
+
+    log.info("TTS API returned 500, trying share API fallback for %s", list_id)
     try:
-        log.info("Fetching Army Forge list: %s", list_id)
-        response = await client.get(tts_url(list_id), timeout=15.0)
-        response.raise_for_status()
-        data = response.json()
-        log.debug("Army data received: %s units", len(data.get("units", [])))
-        return data
-    except httpx.HTTPStatusError as e:
-        log.error("Army Forge HTTP error: %s", e.response.status_code)
-        if e.response.status_code == 404:
-            raise NotFoundException(f"Army list '{list_id}' not found on Army Forge") from e
-        if e.response.status_code == 500:
-            log.info("TTS API returned 500, trying share API fallback for %s", list_id)
+        share_resp = await get_with_retry(client, share_url(list_id), timeout=15.0)
+        share_resp.raise_for_status()
+        share_data = decode_json(share_resp)
+    except Exception as share_err:
+        log.warning("Share API fallback failed: %s", share_err)
+        raise ValidationException(
+            "Army Forge returned an error for this list. Check that the list and any custom or "
+            "Studio army books are set to public in Army Forge Studio. Otherwise add units manually."
+        ) from share_err
+    game_system = share_data.get("gameSystem", "gf")
+    share_units = share_data.get("units", [])
+    army_books: dict[str, dict] = {}
+    for su in share_units:
+        aid = su.get("armyId")
+        if aid and aid not in army_books:
             try:
-                share_resp = await client.get(share_url(list_id), timeout=15.0)
-                share_resp.raise_for_status()
-                share_data = share_resp.json()
-            except Exception as share_err:
-                log.warning("Share API fallback failed: %s", share_err)
-                raise ValidationException(
-                    "Army Forge returned an error for this list. Check that the list and any custom or "
-                    "Studio army books are set to public in Army Forge Studio. Otherwise add units manually."
-                ) from share_err
-            game_system = share_data.get("gameSystem", "gf")
-            share_units = share_data.get("units", [])
-            army_books: dict[str, dict] = {}
-            for su in share_units:
-                aid = su.get("armyId")
-                if aid and aid not in army_books:
-                    try:
-                        book_resp = await client.get(
-                            army_book_url(aid, game_system),
-                            timeout=10.0,
-                        )
-                        book_resp.raise_for_status()
-                        army_books[aid] = book_resp.json()
-                    except Exception as book_err:
-                        log.warning("Could not fetch army book %s: %s", aid, book_err)
-                        army_books[aid] = {}
-            book_units_by_id: dict[str, dict] = {}
-            for aid, book in army_books.items():
-                for u in book.get("units", []):
-                    book_units_by_id[(aid, u.get("id"))] = u
-            tts_units = []
-            for su in share_units:
-                aid = su.get("armyId")
-                uid = su.get("id")
-                book_unit = book_units_by_id.get((aid, uid)) if aid and uid else None
-                book_full = (army_books.get(aid) if aid else None) or {}
-                if book_unit is None and (aid or uid):
-                    log.info(
-                        "Army book unavailable for unit %s (army %s), using placeholder (list/army may be private)",
-                        uid,
-                        aid,
-                    )
-                tts_units.append(share_unit_to_tts(su, book_unit, book_full))
-            army_data = {
-                "gameSystem": game_system,
-                "units": tts_units,
-            }
-            log.info("Share API fallback: converted %s units for %s", len(tts_units), list_id)
-            return army_data
-        raise ValidationException(f"Army Forge API error: {e.response.status_code}") from e
-    except httpx.TimeoutException as e:
-        log.error("Timeout fetching Army Forge list %s", list_id)
-        raise ValidationException("Army Forge request timed out. Please try again.") from e
-    except httpx.RequestError as e:
-        log.error("Request error: %s", str(e))
-        raise ValidationException(f"Failed to connect to Army Forge: {str(e)}") from e
+                book_resp = await limited_get(
+                    client,
+                    army_book_url(aid, game_system),
+                    timeout=10.0,
+                )
+                book_resp.raise_for_status()
+                army_books[aid] = decode_json(book_resp)
+            except Exception as book_err:
+                log.warning("Could not fetch army book %s: %s", aid, book_err)
+                army_books[aid] = {}
+    book_units_by_id: dict[str, dict] = {}
+    for aid, book in army_books.items():
+        for u in book.get("units", []):
+            book_units_by_id[(aid, u.get("id"))] = u
+    tts_units = []
+    for su in share_units:
+        aid = su.get("armyId")
+        uid = su.get("id")
+        book_unit = book_units_by_id.get((aid, uid)) if aid and uid else None
+        book_full = (army_books.get(aid) if aid else None) or {}
+        if book_unit is None and (aid or uid):
+            log.info(
+                "Army book unavailable for unit %s (army %s), using placeholder (list/army may be private)",
+                uid,
+                aid,
+            )
+        tts_units.append(share_unit_to_tts(su, book_unit, book_full))
+    army_data = {
+        "gameSystem": game_system,
+        "units": tts_units,
+    }
+    log.info("Share API fallback: converted %s units for %s", len(tts_units), list_id)
+    return army_data
+
+
+async def fetch_army_list(list_id: str, log: logging.Logger) -> dict[str, Any]:
+    """
+    The one entry point for "give me list ``list_id``" (proxy and import both use it).
+
+    Serves fresh cache hits, otherwise downloads once per list across concurrent
+    callers. If Army Forge fails, an older cached copy is returned when present.
+    """
+    data = cached_list(list_id)
+    if data is not None:
+        return data
+    try:
+        data = await single_flight(
+            list_id,
+            lambda: download_army_forge_list(get_http_client(), list_id, log),
+        )
+    except ValidationException:
+        data = cached_list(list_id, max_age=None)
+        if data is None:
+            raise
+        log.warning("Army Forge fetch failed for %s, serving cached copy", list_id)
+        return data
+    remember_list(list_id, data)
+    return data
 
 
 async def fetch_first_army_book_json(
@@ -112,12 +141,13 @@ async def fetch_first_army_book_json(
             continue
         seen_army_ids.add(army_id)
         try:
-            book_resp = await client.get(
+            book_resp = await limited_get(
+                client,
                 army_book_url(army_id, game_system),
                 timeout=10.0,
             )
             book_resp.raise_for_status()
-            army_book = book_resp.json()
+            army_book = decode_json(book_resp)
             log.info(
                 "Fetched army book '%s' v%s: %s spells, %s rules",
                 army_book.get("name", "?"),
@@ -5,6 +5,30 @@ from typing import List, Optional
 
 from litestar.exceptions import ValidationException
 
+_RAW_LIST_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{5,50}$")
+_LIST_ID_RE = re.compile(r"(?:id=|share/)([a-zA-Z0-9_-]+)")
+# Almost every pasted link has this shape; it is sliced without a regex search.
+_SHARE_URL_PREFIX = "https://army-forge.onepagerules.com/share?id="
+_CASTER_LEVEL_RE = re.compile(r"caster\s*\(\s*(\d+)\s*\)", re.I)
+_CASTER_NAME_RE = re.compile(r"^caster\s*\(\s*\d+\s*\)\s*$")
+# Substrings that mean the user pasted browser console output, not a URL;
+# matched case-insensitively in one pass by _CONSOLE_OUTPUT_RE.
+_CONSOLE_INDICATORS = (
+    "vue.global.js",
+    "console",
+    "error",
+    "warn",
+    "traceback",
+    "exception",
+    "uncaught",
+    "typeerror",
+    "cannot read",
+    "property",
+    "undefined",
+    "null",
+)
+_CONSOLE_OUTPUT_RE = re.compile("|".join(map(re.escape, _CONSOLE_INDICATORS)), re.I)
+
 
 def extract_list_id(url_or_id: str) -> str:
     """Extract list ID from Army Forge share URL or raw ID."""
@@ -13,37 +37,26 @@ def extract_list_id(url_or_id: str) -> str:
 
     url_or_id = url_or_id.strip()
 
-    if any(
-        indicator in url_or_id.lower()
-        for indicator in [
-            "vue.global.js",
-            "console",
-            "error",
-            "warn",
-            "traceback",
-            "exception",
-            "uncaught",
-            "typeerror",
-            "cannot read",
-            "property",
-            "undefined",
-            "null",
-        ]
-    ):
+    if _CONSOLE_OUTPUT_RE.search(url_or_id):
         raise ValidationException(
             "Invalid input detected. Please paste the Army Forge share URL or list ID, not console output. "
             "Example: https://army-forge.onepagerules.com/share?id=XXXXX"
         )
 
+    if url_or_id.startswith(_SHARE_URL_PREFIX):
+        candidate = url_or_id[len(_SHARE_URL_PREFIX):].split("&", 1)[0]
+        if _RAW_LIST_ID_RE.match(candidate):
+            return candidate
+
     if not url_or_id.startswith("http"):
-        if re.match(r"^[a-zA-Z0-9_-]{5,50}$", url_or_id):
+        if _RAW_LIST_ID_RE.match(url_or_id):
             return url_or_id
         raise ValidationException(
             f"Invalid list ID format. Expected alphanumeric characters, dashes, or underscores. "
             f"Got: {url_or_id[:50]}..."
         )
 
-    match = re.search(r"(?:id=|share/)([a-zA-Z0-9_-]+)", url_or_id)
+    match = _LIST_ID_RE.search(url_or_id)
     if match:
         list_id = match.group(1)
         if len(list_id) < 5 or len(list_id) > 50:
@@ -292,37 +305,43 @@ def share_unit_to_tts(
     }
 
 
+_DEFAULT_RULE_PROPS = {
+    "is_hero": False,
+    "is_caster": False,
+    "caster_level": 0,
+    "is_transport": False,
+    "transport_capacity": 0,
+    "has_ambush": False,
+    "has_scout": False,
+    "tough": 1,
+}
+# Rule name (lowercased) -> (boolean property it sets or None,
+# (property taking the rule's rating, value when unrated) or None).
+_RULE_TABLE = {
+    "hero": ("is_hero", None),
+    "caster": ("is_caster", ("caster_level", 1)),
+    "transport": ("is_transport", ("transport_capacity", 6)),
+    "ambush": ("has_ambush", None),
+    "scout": ("has_scout", None),
+    "tough": (None, ("tough", 1)),
+}
+
+
 def parse_special_rules(rules: List[dict]) -> dict:
     """Parse special rules to extract key unit properties."""
-    result = {
-        "is_hero": False,
-        "is_caster": False,
-        "caster_level": 0,
-        "is_transport": False,
-        "transport_capacity": 0,
-        "has_ambush": False,
-        "has_scout": False,
-        "tough": 1,
-    }
+    result = dict(_DEFAULT_RULE_PROPS)
 
     for rule in rules:
-        name = rule.get("name", "").lower()
-        rating = rule.get("rating")
-
-        if name == "hero":
-            result["is_hero"] = True
-        elif name == "caster":
-            result["is_caster"] = True
-            result["caster_level"] = int(rating) if rating else 1
-        elif name == "transport":
-            result["is_transport"] = True
-            result["transport_capacity"] = int(rating) if rating else 6
-        elif name == "ambush":
-            result["has_ambush"] = True
-        elif name == "scout":
-            result["has_scout"] = True
-        elif name == "tough":
-            result["tough"] = int(rating) if rating else 1
+        entry = _RULE_TABLE.get(rule.get("name", "").lower())
+        if entry is None:
+            continue
+        flag, rated = entry
+        if flag:
+            result[flag] = True
+        if rated:
+            key, default = rated
+            rating = rule.get("rating")
+            result[key] = int(rating) if rating else default
 
     return result
 
@@ -336,7 +355,7 @@ def caster_level_from_loadout_item(item: dict) -> int:
             pass
     for field in ("name", "label"):
         text = (item.get(field) or "").strip()
-        m = re.search(r"caster\s*\(\s*(\d+)\s*\)", text, re.I)
+        m = _CASTER_LEVEL_RE.search(text)
         if m:
             return int(m.group(1))
     return 1
@@ -347,7 +366,7 @@ def is_flavor_caster_name(name: str) -> bool:
     if not name or not name.strip():
         return False
     n = name.strip().lower()
-    return "caster" in n and bool(re.search(r"caster\s*\(\s*\d+\s*\)", n))
+    return "caster" in n and bool(_CASTER_LEVEL_RE.search(n))
 
 
 def parse_loadout_for_caster(loadout: list) -> tuple:
@@ -366,7 +385,7 @@ def parse_loadout_for_caster(loadout: list) -> tuple:
         for item in (i for i in items if isinstance(i, dict)):
             name = (item.get("name") or item.get("label") or "").strip()
             name_lower = name.lower()
-            if name_lower == "caster" or re.match(r"^caster\s*\(\s*\d+\s*\)\s*$", name_lower):
+            if name_lower == "caster" or _CASTER_NAME_RE.match(name_lower):
                 is_caster_ref[0] = True
                 caster_level_ref[0] = max(caster_level_ref[0], caster_level_from_loadout_item(item))
                 continue
@@ -411,7 +430,7 @@ def parse_upgrades_for_caster(upgrades: list) -> tuple:
             return
         name = (item.get("name") or item.get("label") or "").strip()
         name_lower = name.lower()
-        if name_lower == "caster" or re.match(r"^caster\s*\(\s*\d+\s*\)\s*$", name_lower):
+        if name_lower == "caster" or _CASTER_NAME_RE.match(name_lower):
             is_caster = True
             caster_level = max(caster_level, caster_level_from_loadout_item(item))
         elif is_flavor_caster_name(name):
@@ -16,6 +16,8 @@ class ArmyForgeWeapon(BaseModel):
     range: Optional[int] = None
     attacks: Optional[int] = None
     specialRules: Optional[List[dict]] = None
+    # Validated like the top level so the proxy response keeps the documented
+    # shape; pydantic resolves the self-reference without a model_rebuild.
     content: Optional[List["ArmyForgeWeapon"]] = None
 
 
@@ -59,6 +61,3 @@ class ImportArmyResponse(BaseModel):
     units_imported: int
     army_name: str
     total_points: int
-
-
-ArmyForgeWeapon.model_rebuild()
@@ -304,17 +304,17 @@ async def require_admin_guard(connection: ASGIConnection, handler: BaseRouteHand
     """Guard to require admin authentication."""
     # ASGIConnection has cookies, url, etc. directly accessible
     path = connection.url.path
-    logger.debug(f"Checking admin authentication for path: {path}")
+    logger.debug("Checking admin authentication for path: %s", path)
     session_id = connection.cookies.get("session_id")
     
     if not session_id:
-        logger.warning(f"Admin access attempted without session_id: {path}")
+        logger.warning("Admin access attempted without session_id: %s", path)
         raise NotAuthorizedException("Not authenticated")
     
     authenticated = await session_store.get(f"{ADMIN_SESSION_KEY}:{session_id}")
     
     if not authenticated:
-        logger.warning(f"Admin access attempted without authentication: {path}, session_id: {session_id}")
+        logger.warning("Admin access attempted without authentication: %s, session_id: %s", path, session_id)
         raise NotAuthorizedException("Not authenticated")
     
     # Optionally verify email is still authorized
@@ -330,9 +330,9 @@ async def require_admin_guard(connection: ASGIConnection, handler: BaseRouteHand
         email = str(email_raw)
     
     if email != GOOGLE_AUTHORIZED_EMAIL:
-        logger.warning(f"Admin access attempted with unauthorized email: {email} (type: {type(email_raw)})")
+        logger.warning("Admin access attempted with unauthorized email: %s (type: %s)", email, type(email_raw))
         raise NotAuthorizedException("Unauthorized")
     
-    logger.debug(f"Admin access granted for: {email}")
+    logger.debug("Admin access granted for: %s", email)
 
 
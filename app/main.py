@@ -72,7 +72,7 @@ def ensure_oauth_from_dotenv() -> None:
 ensure_oauth_from_dotenv()
 
 from litestar import Litestar, Request
-from litestar.contrib.sqlalchemy.plugins import SQLAlchemyInitPlugin, SQLAlchemyAsyncConfig
+from litestar.contrib.sqlalchemy.plugins import EngineConfig, SQLAlchemyInitPlugin, SQLAlchemyAsyncConfig
 from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.template.config import TemplateConfig
 from typing import Any
@@ -80,6 +80,8 @@ from litestar.status_codes import HTTP_500_INTERNAL_SERVER_ERROR, HTTP_401_UNAUT
 from litestar.response import Response, Redirect
 from litestar.exceptions import NotAuthorizedException, HTTPException
 
+from app.army_forge.client import close_http_client
+from app.api.websocket import flush_connection_status
 from app.routes import ROUTES
 from app.models import Base  # Import models Base for table creation
 from app.utils.logging import error_log, log_request_error
@@ -123,11 +125,24 @@ google_client_secret = getenv("GOOGLE_CLIENT_SECRET")
 log_google_oauth_env_status(google_client_id, google_client_secret)
 
 # --- SQLAlchemy config
+# Each request holds its session across awaits (and websocket handlers open
+# their own), so pool_size + max_overflow should cover the number of
+# coroutines that can hit the DB at once per worker. SQLAlchemy's default of
+# 5 + 10 queues requests behind each other well before the CPU is busy.
+DB_POOL_SIZE = int(getenv("DB_POOL_SIZE", "25"))
+DB_MAX_OVERFLOW = int(getenv("DB_MAX_OVERFLOW", "25"))
+
 config = SQLAlchemyAsyncConfig(
     connection_string=DATABASE_URL,
     session_dependency_key="session",
     metadata=Base.metadata,  # Use our models' metadata
     create_all=DEBUG,  # Auto-create tables on startup (dev only)
+    engine_config=EngineConfig(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,  # Drop connections the server closed while idle
+        pool_recycle=1800,
+    ),
 )
 plugin = SQLAlchemyInitPlugin(config)
 
@@ -156,6 +171,12 @@ def register_template_globals(engine: JinjaTemplateEngine) -> None:
     
     # Register DEBUG flag as a global so templates can access it
     engine.register_template_callable("APP_DEBUG", lambda ctx: DEBUG)
+    
+    # Templates only change on deploy: skip Jinja's per-render mtime check in
+    # production and parse every template now instead of on its first hit.
+    engine.engine.auto_reload = DEBUG
+    for name in engine.engine.list_templates(extensions=["html"]):
+        engine.engine.get_template(name)
 
 template_config = TemplateConfig(
     directory=template_dirs,
@@ -287,6 +308,7 @@ app = Litestar(
     plugins=[plugin],
     template_config=template_config,
     on_startup=[run_startup_migrations],
+    on_shutdown=[flush_connection_status, close_http_client],
     exception_handlers={
         Exception: log_exceptions,
         NotAuthorizedException: handle_auth_exception,
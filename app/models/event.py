@@ -2,9 +2,10 @@
 
 import enum
 import uuid
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional, Any, Dict
 
-from sqlalchemy import String, Integer, ForeignKey, Enum, JSON, Text
+from sqlalchemy import DateTime, String, Integer, ForeignKey, Enum, JSON, Index, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -79,6 +80,28 @@ class GameEvent(Base):
     """
     
     __tablename__ = "game_events"
+    __table_args__ = (
+        # Serves the action-log page query (game_id = ? AND NOT is_undone
+        # ORDER BY created_at DESC, id DESC) as an index range scan; partial so
+        # undone rows stay out of the index.
+        Index(
+            "ix_game_events_game_id_created_at_active",
+            "game_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_undone = false"),
+            sqlite_where=text("is_undone = 0"),
+        ),
+    )
+    
+    # Stamped in Python so events logged within one transaction keep their
+    # insertion order (Postgres now() is fixed per transaction); the action log
+    # pages on (created_at, id).
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+    )
     
     # Which game this event belongs to
     game_id: Mapped[uuid.UUID] = mapped_column(
@@ -129,31 +152,5 @@ class GameEvent(Base):
     # Relationships
     game: Mapped["Game"] = relationship("Game", back_populates="events")
     
-    @classmethod
-    def create(
-        cls,
-        game_id: uuid.UUID,
-        event_type: EventType,
-        description: str,
-        player_id: Optional[uuid.UUID] = None,
-        round_number: int = 1,
-        target_unit_id: Optional[uuid.UUID] = None,
-        target_objective_id: Optional[uuid.UUID] = None,
-        details: Optional[Dict[str, Any]] = None,
-        previous_state: Optional[Dict[str, Any]] = None,
-    ) -> "GameEvent":
-        """Factory method to create a new event."""
-        return cls(
-            game_id=game_id,
-            player_id=player_id,
-            event_type=event_type,  # EventType is str enum, so this is already the value string
-            description=description,
-            round_number=round_number,
-            target_unit_id=target_unit_id,
-            target_objective_id=target_objective_id,
-            details=details,
-            previous_state=previous_state,
-        )
-    
     def __repr__(self) -> str:
         return f"<GameEvent R{self.round_number} {self.event_type.value}: {self.description[:50]}>"
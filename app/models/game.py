@@ -7,8 +7,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, Integer, Enum, ForeignKey, Boolean, DateTime
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Integer, Enum, ForeignKey, Boolean, DateTime, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.models.base import Base
 
@@ -45,6 +45,11 @@ class Game(Base):
     """A game session between players."""
     
     __tablename__ = "games"
+    __table_args__ = (
+        # Codes are stored upper-case so lookups can compare the (upper-cased)
+        # user input against the plain unique index on code.
+        CheckConstraint("code = upper(code)", name="ck_games_code_upper"),
+    )
     
     # Join code for players to connect (e.g., "ABC123")
     code: Mapped[str] = mapped_column(
@@ -110,5 +115,9 @@ class Game(Base):
         order_by="GameEvent.created_at",
     )
     
+    @validates("code")
+    def _normalize_code(self, key: str, code: str) -> str:
+        return code.upper()
+    
     def __repr__(self) -> str:
         return f"<Game {self.code} ({self.game_system.value}) - {self.status.value}>"
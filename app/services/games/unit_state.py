@@ -2,13 +2,15 @@
 
 import uuid
 from datetime import datetime, timedelta, timezone
+from typing import List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
 from app.api.game_helpers import log_event
 from app.api.game_schemas import UpdateUnitStateRequest
-from app.models import DeploymentStatus, EventType, Game, GameEvent, Unit
+from app.models import DeploymentStatus, EventType, Game, GameEvent, Unit, UnitState
 from app.services.games.errors import UnitStateValidationError
 
 
@@ -19,7 +21,12 @@ async def apply_update_unit_state(
     unit_id: uuid.UUID,
     data: UpdateUnitStateRequest,
 ) -> None:
-    """Mutate unit.state and create/delete GameEvent rows as needed."""
+    """Mutate unit.state and create/delete GameEvent rows as needed.
+
+    New events are collected and added to the session in one batch at the end,
+    so a mid-update query cannot autoflush them one at a time.
+    """
+    events: List[GameEvent] = []
     if data.wounds_taken is not None and data.wounds_taken != unit.state.wounds_taken:
         previous_state = {"wounds_taken": unit.state.wounds_taken}
         wound_diff = data.wounds_taken - unit.state.wounds_taken
@@ -42,6 +49,7 @@ async def apply_update_unit_state(
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     },
                     previous_state={"wounds_taken": wounds_at_this_point},
+                    events=events,
                 )
         else:
             wounds_to_remove = abs(wound_diff)
@@ -73,6 +81,7 @@ async def apply_update_unit_state(
                         player_id=unit.player_id,
                         target_unit_id=unit.id,
                         details={"wounds_healed": 1},
+                        events=events,
                     )
 
     if data.models_remaining is not None:
@@ -94,6 +103,7 @@ async def apply_update_unit_state(
                 f"{unit.display_name} activated",
                 player_id=unit.player_id,
                 target_unit_id=unit.id,
+                events=events,
             )
 
             if unit.attached_heroes:
@@ -107,6 +117,7 @@ async def apply_update_unit_state(
                             f"{attached_hero.display_name} activated (attached to {unit.display_name})",
                             player_id=attached_hero.player_id,
                             target_unit_id=attached_hero.id,
+                            events=events,
                         )
 
     if data.is_shaken is not None and data.is_shaken != unit.state.is_shaken:
@@ -119,6 +130,7 @@ async def apply_update_unit_state(
                 f"{unit.display_name} became Shaken",
                 player_id=unit.player_id,
                 target_unit_id=unit.id,
+                events=events,
             )
         else:
             await log_event(
@@ -128,6 +140,7 @@ async def apply_update_unit_state(
                 f"{unit.display_name} is no longer Shaken",
                 player_id=unit.player_id,
                 target_unit_id=unit.id,
+                events=events,
             )
 
         if unit.attached_heroes:
@@ -142,6 +155,7 @@ async def apply_update_unit_state(
                             f"{attached_hero.display_name} became Shaken (attached to {unit.display_name})",
                             player_id=attached_hero.player_id,
                             target_unit_id=attached_hero.id,
+                            events=events,
                         )
                     else:
                         await log_event(
@@ -151,6 +165,7 @@ async def apply_update_unit_state(
                             f"{attached_hero.display_name} is no longer Shaken (attached to {unit.display_name})",
                             player_id=attached_hero.player_id,
                             target_unit_id=attached_hero.id,
+                            events=events,
                         )
 
     if data.is_fatigued is not None:
@@ -162,6 +177,7 @@ async def apply_update_unit_state(
                 EventType.STATUS_FATIGUED,
                 f"{unit.display_name} became Fatigued",
                 target_unit_id=unit.id,
+                events=events,
             )
 
     if data.deployment_status is not None and data.deployment_status != unit.state.deployment_status:
@@ -175,6 +191,7 @@ async def apply_update_unit_state(
                 EventType.UNIT_DEPLOYED,
                 f"{unit.display_name} deployed from Ambush",
                 target_unit_id=unit.id,
+                events=events,
             )
         elif data.deployment_status == DeploymentStatus.DESTROYED:
             await log_event(
@@ -183,6 +200,7 @@ async def apply_update_unit_state(
                 EventType.UNIT_DESTROYED,
                 f"{unit.display_name} was destroyed",
                 target_unit_id=unit.id,
+                events=events,
             )
 
             parent_was_shaken = unit.state.is_shaken
@@ -198,6 +216,7 @@ async def apply_update_unit_state(
                                 f"{attached_hero.display_name} remains Shaken after detachment (parent was Shaken)",
                                 player_id=attached_hero.player_id,
                                 target_unit_id=attached_hero.id,
+                                events=events,
                             )
 
                     attached_hero.attached_to_unit_id = None
@@ -208,28 +227,34 @@ async def apply_update_unit_state(
                         f"{attached_hero.display_name} detached from {unit.display_name} (parent destroyed)",
                         player_id=attached_hero.player_id,
                         target_unit_id=attached_hero.id,
+                        events=events,
                     )
 
             if unit.is_transport:
-                all_units = [u for p in game.players for u in p.units]
-                for passenger in all_units:
-                    if passenger.state and passenger.state.transport_id == unit.id:
-                        passenger.state.transport_id = None
-                        passenger.state.deployment_status = DeploymentStatus.DEPLOYED
-                        passenger.state.is_shaken = True
-                        await log_event(
-                            session,
-                            game,
-                            EventType.UNIT_DISEMBARKED,
-                            (
-                                f"{passenger.display_name} emergency disembarked from "
-                                f"{unit.display_name} (destroyed) — Shaken, "
-                                f"dangerous terrain test required"
-                            ),
-                            player_id=passenger.player_id,
-                            target_unit_id=passenger.id,
-                            details={"reason": "transport_destroyed", "dangerous_terrain_test": True},
-                        )
+                result = await session.execute(
+                    select(Unit)
+                    .join(UnitState, UnitState.unit_id == Unit.id)
+                    .where(UnitState.transport_id == unit.id)
+                    .options(contains_eager(Unit.state))
+                )
+                for passenger in result.scalars():
+                    passenger.state.transport_id = None
+                    passenger.state.deployment_status = DeploymentStatus.DEPLOYED
+                    passenger.state.is_shaken = True
+                    await log_event(
+                        session,
+                        game,
+                        EventType.UNIT_DISEMBARKED,
+                        (
+                            f"{passenger.display_name} emergency disembarked from "
+                            f"{unit.display_name} (destroyed) — Shaken, "
+                            f"dangerous terrain test required"
+                        ),
+                        player_id=passenger.player_id,
+                        target_unit_id=passenger.id,
+                        details={"reason": "transport_destroyed", "dangerous_terrain_test": True},
+                        events=events,
+                    )
 
     if "transport_id" in data.model_fields_set:
         if data.transport_id is not None:
@@ -241,6 +266,7 @@ async def apply_update_unit_state(
                 EventType.UNIT_EMBARKED,
                 f"{unit.display_name} embarked on transport",
                 target_unit_id=unit.id,
+                events=events,
             )
         elif unit.state.transport_id is not None:
             unit.state.transport_id = None
@@ -251,6 +277,7 @@ async def apply_update_unit_state(
                 EventType.UNIT_DISEMBARKED,
                 f"{unit.display_name} disembarked from transport",
                 target_unit_id=unit.id,
+                events=events,
             )
 
     if data.spell_tokens is not None and data.spell_tokens != unit.state.spell_tokens:
@@ -266,6 +293,7 @@ async def apply_update_unit_state(
                 f"{unit.display_name} gained {diff} spell token(s) ({unit.state.spell_tokens}/6)",
                 target_unit_id=unit.id,
                 details={"tokens_gained": diff, "tokens_total": unit.state.spell_tokens},
+                events=events,
             )
         elif diff < 0:
             await log_event(
@@ -275,22 +303,27 @@ async def apply_update_unit_state(
                 f"{unit.display_name} spent {-diff} spell token(s) ({unit.state.spell_tokens}/6)",
                 target_unit_id=unit.id,
                 details={"tokens_spent": -diff, "tokens_total": unit.state.spell_tokens},
+                events=events,
             )
 
     if data.limited_weapons_used is not None:
         old_weapons = unit.state.limited_weapons_used or []
         unit.state.limited_weapons_used = data.limited_weapons_used
 
-        new_weapons = set(data.limited_weapons_used) - set(old_weapons)
-        for weapon in new_weapons:
+        new_weapons = sorted(set(data.limited_weapons_used) - set(old_weapons))
+        if new_weapons:
             await log_event(
                 session,
                 game,
                 EventType.LIMITED_WEAPON_USED,
-                f"{unit.display_name} used {weapon} (Limited)",
+                f"{unit.display_name} used {', '.join(new_weapons)} (Limited)",
                 target_unit_id=unit.id,
-                details={"weapon_name": weapon},
+                details={"weapons": new_weapons},
+                events=events,
             )
 
     if data.custom_notes is not None:
         unit.state.custom_notes = data.custom_notes
+
+    if events:
+        session.add_all(events)
@@ -89,6 +89,26 @@ async def check_column_exists(engine, table: str, column: str) -> bool:
             """), {"table": table, "column": column})
             return result.scalar_one_or_none() is not None
 
+async def check_index_exists(engine, index_name: str) -> bool:
+    """Check if an index exists (PostgreSQL)."""
+    async with engine.connect() as conn:
+        result = await conn.execute(text("""
+            SELECT 1
+            FROM pg_indexes
+            WHERE schemaname = 'public' AND indexname = :name
+        """), {"name": index_name})
+        return result.scalar_one_or_none() is not None
+
+async def check_constraint_exists(engine, table: str, constraint_name: str) -> bool:
+    """Check if a named constraint exists on a table (PostgreSQL)."""
+    async with engine.connect() as conn:
+        result = await conn.execute(text("""
+            SELECT 1
+            FROM pg_constraint
+            WHERE conname = :name AND conrelid = CAST(:table AS regclass)
+        """), {"name": constraint_name, "table": table})
+        return result.scalar_one_or_none() is not None
+
 async def check_migration_status(engine) -> dict:
     """Check which migrations have been applied."""
     status = {
@@ -97,6 +117,8 @@ async def check_migration_status(engine) -> dict:
         "has_unit_detached": False,
         "has_unit_actions": False,
         "has_player_army_book": False,
+        "has_game_events_page_index": False,
+        "has_games_code_upper_check": False,
     }
     
     # Check for solo mode column
@@ -118,6 +140,16 @@ async def check_migration_status(engine) -> dict:
             break
     status["has_unit_actions"] = all_present
     
+    # Check for action-log pagination index
+    status["has_game_events_page_index"] = await check_index_exists(
+        engine, "ix_game_events_game_id_created_at_active"
+    )
+    
+    # Check for upper-case join code constraint
+    status["has_games_code_upper_check"] = await check_constraint_exists(
+        engine, "games", "ck_games_code_upper"
+    )
+    
     return status
 
 async def run_migration_script(script_path: Path, database_url: str) -> bool:
@@ -201,6 +233,12 @@ async def main():
         if not status["has_player_army_book"]:
             migrations_to_run.append(DEPLOY_DIR / "migrate_add_player_army_book.py")
         
+        if not status["has_game_events_page_index"]:
+            migrations_to_run.append(DEPLOY_DIR / "migrate_add_game_events_page_index.py")
+        
+        if not status["has_games_code_upper_check"]:
+            migrations_to_run.append(DEPLOY_DIR / "migrate_add_games_code_upper_check.py")
+        
         if not migrations_to_run:
             print("✓ All migrations are up to date")
             return 0
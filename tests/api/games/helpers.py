@@ -1,13 +1,13 @@
 """Shared async helpers for games API tests."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, patch
 
 
 async def create_game_with_manual_unit(client, *, is_caster: bool = False, caster_level: int = 0):
     """
     Create a game with host only, add one manual unit, return ``(code, host_id, unit_id)``.
 
-    Mocks ``broadcast_to_game`` around the manual-unit POST to avoid WS side effects.
+    Mocks ``schedule_broadcast`` around the manual-unit POST to avoid WS side effects.
     """
     resp = await client.post(
         "/api/games",
@@ -26,7 +26,7 @@ async def create_game_with_manual_unit(client, *, is_caster: bool = False, caste
         "is_caster": is_caster,
         "caster_level": caster_level,
     }
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp_unit = await client.post(f"/api/games/{code}/units/manual", json=payload)
     assert resp_unit.status_code == 201
     unit_id = resp_unit.json()["id"]
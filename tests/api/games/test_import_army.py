@@ -1,10 +1,11 @@
+import asyncio
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 @pytest.mark.asyncio
-async def test_import_army_broadcasts_state_update(client):
+async def test_import_army_broadcasts_state_update(client, fake_response):
     # create game and join second player
     resp = await client.post(
         "/api/games",
@@ -33,19 +34,11 @@ async def test_import_army_broadcasts_state_update(client):
     ]
 
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-
-            def raise_for_status(self): ...
-
-            def json(self):
-                return {"units": fake_units}
-
-        return FakeResponse()
+        return fake_response({"units": fake_units})
 
     # patch httpx.AsyncClient.get and broadcast_to_game to avoid side effects
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
-        "app.army_forge.import_service.broadcast_to_game", new=AsyncMock()
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
     ):
         resp_import = await client.post(
             f"/api/proxy/import-army/{code}",
@@ -61,9 +54,39 @@ async def test_import_army_broadcasts_state_update(client):
     units = updated.json().get("units", [])
     assert any(u["name"] == "Test Unit" for u in units)
 
+    events = (await client.get(f"/api/games/{code}/events")).json()
+    assert any(e["event_type"] == "army_imported" for e in events)
+
+
+@pytest.mark.asyncio
+async def test_import_army_builds_large_lists_in_worker_thread(client, monkeypatch, fake_response):
+    resp = await client.post(
+        "/api/games",
+        json={"name": "ThreadTest", "player_name": "Host", "player_color": "#111111"},
+    )
+    code = resp.json()["code"]
+    host_id = resp.json()["players"][0]["id"]
+    monkeypatch.setattr("app.army_forge.import_service.THREADED_BUILD_MIN_UNITS", 1)
+
+    async def fake_get(url, *args, **kwargs):
+        return fake_response({"units": [{"name": "Threaded Unit", "quality": 4, "defense": 4, "size": 1, "cost": 80,
+                                         "rules": [], "selectedUpgrades": [], "id": "u1", "selectionId": "s1"}]})
+
+    to_thread = AsyncMock(side_effect=asyncio.to_thread)
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
+    ), patch("app.army_forge.import_service.asyncio.to_thread", new=to_thread):
+        resp_import = await client.post(
+            f"/api/proxy/import-army/{code}",
+            json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=THREAD123", "player_id": host_id},
+        )
+    assert resp_import.status_code in (200, 201)
+    assert resp_import.json()["units_imported"] == 1
+    to_thread.assert_awaited_once()
+
 
 @pytest.mark.asyncio
-async def test_import_army_share_api_fallback_on_tts_500(client):
+async def test_import_army_share_api_fallback_on_tts_500(client, fake_response):
     """When TTS API returns 500, fall back to share API + army books."""
     resp = await client.post(
         "/api/games",
@@ -112,33 +135,15 @@ async def test_import_army_share_api_fallback_on_tts_500(client):
         nonlocal call_count
         call_count += 1
         if "api/tts" in url:
-            class TTS500:
-                status_code = 500
-                text = ""
-                def raise_for_status(self):
-                    import httpx
-                    raise httpx.HTTPStatusError("500", request=None, response=self)
-                def json(self):
-                    return {}
-            return TTS500()
+            return fake_response({}, status_code=500)
         if "api/share" in url:
-            class ShareOK:
-                status_code = 200
-                def raise_for_status(self): ...
-                def json(self):
-                    return share_data
-            return ShareOK()
+            return fake_response(share_data)
         if "api/army-books" in url:
-            class BookOK:
-                status_code = 200
-                def raise_for_status(self): ...
-                def json(self):
-                    return army_book
-            return BookOK()
+            return fake_response(army_book)
         raise ValueError(f"Unexpected URL: {url}")
 
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
-        "app.army_forge.import_service.broadcast_to_game", new=AsyncMock()
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
     ):
         resp_import = await client.post(
             f"/api/proxy/import-army/{code}",
@@ -155,7 +160,7 @@ async def test_import_army_share_api_fallback_on_tts_500(client):
 
 
 @pytest.mark.asyncio
-async def test_army_forge_import_accumulates_units(client):
+async def test_army_forge_import_accumulates_units(client, fake_response):
     """Test that Army Forge import adds units instead of replacing them."""
     # Create game and join second player
     resp = await client.post(
@@ -186,15 +191,10 @@ async def test_army_forge_import_accumulates_units(client):
     ]
     
     async def fake_get_1(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units_1}
-        return FakeResponse()
+        return fake_response({"units": fake_units_1})
     
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get_1)), patch(
-        "app.army_forge.import_service.broadcast_to_game", new=AsyncMock()
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get_1)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
     ):
         resp_import1 = await client.post(
             f"/api/proxy/import-army/{code}",
@@ -225,15 +225,10 @@ async def test_army_forge_import_accumulates_units(client):
     ]
     
     async def fake_get_2(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units_2}
-        return FakeResponse()
+        return fake_response({"units": fake_units_2})
     
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get_2)), patch(
-        "app.army_forge.import_service.broadcast_to_game", new=AsyncMock()
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get_2)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
     ):
         resp_import2 = await client.post(
             f"/api/proxy/import-army/{code}",
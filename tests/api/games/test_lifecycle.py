@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -50,13 +50,13 @@ async def test_player_join_broadcasts(client):
     )
     code = resp.json()["code"]
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()) as mock_broadcast:
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()) as mock_broadcast:
         resp_join = await client.post(
             f"/api/games/{code}/join",
             json={"player_name": "Joiner", "player_color": "#123123"},
         )
         assert resp_join.status_code == 201
-        mock_broadcast.assert_awaited_once()
-        args, kwargs = mock_broadcast.await_args
+        mock_broadcast.assert_called_once()
+        args, kwargs = mock_broadcast.call_args
         assert args[0] == code
         assert args[1]["type"] == "player_joined"
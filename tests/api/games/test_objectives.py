@@ -1,7 +1,7 @@
 """Tests for objectives API."""
 
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -23,6 +23,8 @@ async def test_create_and_update_objectives(client):
     assert r1.status_code == 201
     objs = r1.json()
     assert len(objs) == 3
+    assert [o["marker_number"] for o in objs] == [1, 2, 3]
+    assert all(o["status"] == "neutral" for o in objs)
     oid = objs[0]["id"]
 
     r_dup = await client.post(f"/api/games/{code}/objectives", json={"count": 3})
@@ -35,21 +37,21 @@ async def test_create_and_update_objectives(client):
     )
     assert r_nf.status_code == 404
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.objectives.schedule_broadcast", new=MagicMock()):
         r_seize = await client.patch(
             f"/api/games/{code}/objectives/{oid}",
             json={"status": "seized", "controlled_by_id": host_id},
         )
     assert r_seize.status_code == 200
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.objectives.schedule_broadcast", new=MagicMock()):
         r_contest = await client.patch(
             f"/api/games/{code}/objectives/{oid}",
             json={"status": "contested"},
         )
     assert r_contest.status_code == 200
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.objectives.schedule_broadcast", new=MagicMock()):
         r_neutral = await client.patch(
             f"/api/games/{code}/objectives/{oid}",
             json={"status": "neutral"},
@@ -70,9 +72,42 @@ async def test_seized_without_controller_skips_seize_log(client):
     )
     r1 = await client.post(f"/api/games/{code}/objectives", json={"count": 3})
     oid = r1.json()[0]["id"]
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.objectives.schedule_broadcast", new=MagicMock()):
         r = await client.patch(
             f"/api/games/{code}/objectives/{oid}",
             json={"status": "seized"},
         )
     assert r.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_update_objective_unknown_game(client):
+    r = await client.patch(
+        f"/api/games/NOPE99/objectives/{uuid.uuid4()}",
+        json={"status": "neutral"},
+    )
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_objectives_for_deleted_cached_game(client, test_db_url):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    resp = await client.post(
+        "/api/games",
+        json={"name": "Gone", "player_name": "Host", "player_color": "#111111"},
+    )
+    code = resp.json()["code"]
+    # Caches the code -> id mapping
+    assert (await client.get(f"/api/games/{code}/events")).status_code == 200
+
+    engine = create_async_engine(test_db_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM games WHERE code = :code"), {"code": code})
+    finally:
+        await engine.dispose()
+
+    r = await client.post(f"/api/games/{code}/objectives", json={"count": 3})
+    assert r.status_code == 404
@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -56,7 +56,7 @@ async def test_log_unit_action_rush(client):
     await client.post(f"/api/games/{code}/start")
     
     # Log a rush action
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp_action = await client.post(
             f"/api/games/{code}/units/{unit_id}/actions",
             json={"action": "rush"},
@@ -135,7 +135,7 @@ async def test_log_unit_action_charge_with_targets(client):
     await client.post(f"/api/games/{code}/start")
     
     # Log a charge action with target
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp_action = await client.post(
             f"/api/games/{code}/units/{unit1_id}/actions",
             json={"action": "charge", "target_unit_ids": [unit2_id]},
@@ -281,10 +281,10 @@ async def test_cast_spell_success_deducts_tokens(client):
     )
     assert join_resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp = await client.post(
             f"/api/games/{code}/units/{unit_id}/cast",
             json={"spell_value": 1, "spell_name": "Smite", "success": True},
@@ -317,10 +317,10 @@ async def test_cast_spell_failure_still_deducts_tokens(client):
     )
     assert join_resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp = await client.post(
             f"/api/games/{code}/units/{unit_id}/cast",
             json={"spell_value": 1, "spell_name": "Smite", "success": False},
@@ -348,17 +348,17 @@ async def test_cast_spell_insufficient_tokens(client):
     )
     assert join_resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp = await client.post(
             f"/api/games/{code}/units/{unit_id}/cast",
             json={"spell_value": 1, "spell_name": "Smite", "success": True},
         )
     assert resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp2 = await client.post(
             f"/api/games/{code}/units/{unit_id}/cast",
             json={"spell_value": 1, "spell_name": "Smite", "success": True},
@@ -379,10 +379,10 @@ async def test_cast_spell_non_caster_rejected(client):
     )
     assert join_resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp = await client.post(
             f"/api/games/{code}/units/{unit_id}/cast",
             json={"spell_value": 1, "spell_name": "Smite", "success": True},
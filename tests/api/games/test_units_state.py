@@ -1,12 +1,12 @@
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from .helpers import create_game_with_manual_unit
 
 @pytest.mark.asyncio
-async def test_wound_tracking_creates_individual_events(client):
+async def test_wound_tracking_creates_individual_events(client, fake_response):
     """Test that wound tracking creates one log entry per wound."""
     # Create game, join, and create a unit
     resp = await client.post(
@@ -35,14 +35,9 @@ async def test_wound_tracking_creates_individual_events(client):
     }]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -70,7 +65,7 @@ async def test_wound_tracking_creates_individual_events(client):
 
 
 @pytest.mark.asyncio
-async def test_attached_units_cannot_activate_separately(client):
+async def test_attached_units_cannot_activate_separately(client, fake_response):
     """Test that attached heroes cannot be activated separately."""
     # Create game and import units with attachments
     resp = await client.post(
@@ -113,14 +108,9 @@ async def test_attached_units_cannot_activate_separately(client):
     ]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -145,7 +135,7 @@ async def test_attached_units_cannot_activate_separately(client):
 
 
 @pytest.mark.asyncio
-async def test_activating_parent_activates_attached_heroes(client):
+async def test_activating_parent_activates_attached_heroes(client, fake_response):
     """Test that activating a parent unit also activates attached heroes."""
     # Create game and import units with attachments
     resp = await client.post(
@@ -191,14 +181,9 @@ async def test_activating_parent_activates_attached_heroes(client):
     ]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -242,7 +227,7 @@ async def test_activating_parent_activates_attached_heroes(client):
 
 
 @pytest.mark.asyncio
-async def test_manual_detachment(client):
+async def test_manual_detachment(client, fake_response):
     """Test manual detachment of attached heroes."""
     # Create game and import units with attachments
     resp = await client.post(
@@ -285,14 +270,9 @@ async def test_manual_detachment(client):
     ]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -327,7 +307,7 @@ async def test_manual_detachment(client):
 
 
 @pytest.mark.asyncio
-async def test_automatic_detachment_on_destroy(client):
+async def test_automatic_detachment_on_destroy(client, fake_response):
     """Test that attached heroes are automatically detached when parent is destroyed."""
     # Create game and import units with attachments
     resp = await client.post(
@@ -370,14 +350,9 @@ async def test_automatic_detachment_on_destroy(client):
     ]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -421,7 +396,7 @@ async def test_automatic_detachment_on_destroy(client):
 
 
 @pytest.mark.asyncio
-async def test_shaken_status_preserved_on_detachment(client):
+async def test_shaken_status_preserved_on_detachment(client, fake_response):
     """Test that shaken status is preserved when a shaken parent unit is destroyed."""
     # Create game and import units with attachments
     resp = await client.post(
@@ -464,14 +439,9 @@ async def test_shaken_status_preserved_on_detachment(client):
     ]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -525,7 +495,7 @@ async def test_shaken_status_preserved_on_detachment(client):
 
 
 @pytest.mark.asyncio
-async def test_shaken_unshaken_logging(client):
+async def test_shaken_unshaken_logging(client, fake_response):
     """Test that shaken/unshaken state changes are logged."""
     # Create game and import a unit
     resp = await client.post(
@@ -554,14 +524,9 @@ async def test_shaken_unshaken_logging(client):
     }]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         await client.post(
             f"/api/proxy/import-army/{code}",
             json={"army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345", "player_id": host_id},
@@ -602,7 +567,7 @@ async def test_shaken_unshaken_logging(client):
 
 
 @pytest.mark.asyncio
-async def test_clear_all_units_success(client):
+async def test_clear_all_units_success(client, fake_response):
     """Test clearing all units for a player."""
     # Create game and join second player
     resp = await client.post(
@@ -644,15 +609,10 @@ async def test_clear_all_units_success(client):
     ]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
-        "app.army_forge.import_service.broadcast_to_game", new=AsyncMock()
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
     ):
         await client.post(
             f"/api/proxy/import-army/{code}",
@@ -665,7 +625,7 @@ async def test_clear_all_units_success(client):
     assert len(units) == 2
     
     # Clear all units
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()) as mock_broadcast:
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()) as mock_broadcast:
         resp_clear = await client.delete(f"/api/games/{code}/players/{host_id}/units")
         assert resp_clear.status_code == 200
         data = resp_clear.json()
@@ -674,8 +634,8 @@ async def test_clear_all_units_success(client):
         assert "2 units" in data["message"]
         
         # Verify broadcast was called
-        mock_broadcast.assert_awaited_once()
-        args, kwargs = mock_broadcast.await_args
+        mock_broadcast.assert_called_once()
+        args, kwargs = mock_broadcast.call_args
         assert args[0] == code
         assert args[1]["type"] == "state_update"
         assert args[1]["data"]["reason"] == "units_cleared"
@@ -705,7 +665,7 @@ async def test_clear_all_units_success(client):
 
 
 @pytest.mark.asyncio
-async def test_clear_all_units_blocked_when_game_started(client):
+async def test_clear_all_units_blocked_when_game_started(client, fake_response):
     """Test that clearing units is blocked when game has started."""
     # Create game, join, and add units
     resp = await client.post(
@@ -733,15 +693,10 @@ async def test_clear_all_units_blocked_when_game_started(client):
     }]
     
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units}
-        return FakeResponse()
-    
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
-        "app.army_forge.import_service.broadcast_to_game", new=AsyncMock()
+        return fake_response({"units": fake_units})
+    
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), patch(
+        "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
     ):
         await client.post(
             f"/api/proxy/import-army/{code}",
@@ -778,7 +733,7 @@ async def test_clear_all_units_with_no_units(client):
     )
     
     # Clear units when player has none
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp_clear = await client.delete(f"/api/games/{code}/players/{host_id}/units")
         assert resp_clear.status_code == 200
         data = resp_clear.json()
@@ -810,7 +765,7 @@ async def test_manual_unit_with_loadout_rules_upgrades(client):
         ],
         "upgrades": [{"name": "Veteran"}, {"name": "Weapon Upgrade", "content": [{"name": "Plasma"}]}],
     }
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp_unit = await client.post(f"/api/games/{code}/units/manual", json=create_payload)
     assert resp_unit.status_code == 201
     data = resp_unit.json()
@@ -832,7 +787,7 @@ async def test_delete_unit_in_lobby(client):
     """Deleting a unit in lobby removes it and updates player stats."""
     code, host_id, unit_id = await create_game_with_manual_unit(client)
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.units_state.schedule_broadcast", new=MagicMock()):
         resp = await client.delete(f"/api/games/{code}/units/{unit_id}")
     assert resp.status_code == 200
     assert resp.json()["success"] is True
@@ -856,7 +811,7 @@ async def test_delete_unit_not_found(client):
     code = resp.json()["code"]
     fake_id = str(uuid.uuid4())
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.units_state.schedule_broadcast", new=MagicMock()):
         resp = await client.delete(f"/api/games/{code}/units/{fake_id}")
     assert resp.status_code == 404
 
@@ -873,17 +828,17 @@ async def test_delete_unit_after_start_rejected(client):
     assert join_resp.status_code == 201
     guest_id = next(p["id"] for p in join_resp.json()["players"] if p["name"] == "Guest")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/units/manual", json={
             "player_id": guest_id, "name": "Guest Squad",
             "quality": 4, "defense": 4, "size": 1, "tough": 1, "cost": 50,
         })
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         start_resp = await client.post(f"/api/games/{code}/start")
     assert start_resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.units_state.schedule_broadcast", new=MagicMock()):
         resp = await client.delete(f"/api/games/{code}/units/{unit_id}")
     assert resp.status_code in (400, 422, 500)
 
@@ -893,7 +848,7 @@ async def test_rename_unit_in_lobby(client):
     """Renaming a unit in lobby sets custom_name and returns updated unit."""
     code, host_id, unit_id = await create_game_with_manual_unit(client)
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp = await client.patch(
             f"/api/games/{code}/units/{unit_id}/profile",
             json={"custom_name": "Alpha Squad"},
@@ -907,7 +862,7 @@ async def test_rename_unit_empty_clears_name(client):
     """Sending empty string for custom_name clears it back to None."""
     code, host_id, unit_id = await create_game_with_manual_unit(client)
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         await client.patch(
             f"/api/games/{code}/units/{unit_id}/profile",
             json={"custom_name": "Temp Name"},
@@ -932,16 +887,16 @@ async def test_rename_unit_after_start_rejected(client):
     assert join_resp.status_code == 201
     guest_id = next(p["id"] for p in join_resp.json()["players"] if p["name"] == "Guest")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/units/manual", json={
             "player_id": guest_id, "name": "Guest Squad",
             "quality": 4, "defense": 4, "size": 1, "tough": 1, "cost": 50,
         })
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         resp = await client.patch(
             f"/api/games/{code}/units/{unit_id}/profile",
             json={"custom_name": "Nope"},
@@ -960,7 +915,7 @@ async def test_transport_destroyed_auto_disembarks_passengers(client):
     host_id = resp.json()["players"][0]["id"]
 
     # Create a transport
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         t_resp = await client.post(f"/api/games/{code}/units/manual", json={
             "player_id": host_id, "name": "APC", "quality": 4, "defense": 3,
             "size": 1, "tough": 3, "cost": 150,
@@ -970,7 +925,7 @@ async def test_transport_destroyed_auto_disembarks_passengers(client):
     transport_id = t_resp.json()["id"]
 
     # Create a passenger unit
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         p_resp = await client.post(f"/api/games/{code}/units/manual", json={
             "player_id": host_id, "name": "Infantry", "quality": 4, "defense": 4,
             "size": 5, "tough": 1, "cost": 100,
@@ -986,18 +941,18 @@ async def test_transport_destroyed_auto_disembarks_passengers(client):
     assert join_resp.status_code == 201
     guest_id = join_resp.json()["your_player_id"]
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         g_resp = await client.post(f"/api/games/{code}/units/manual", json={
             "player_id": guest_id, "name": "Enemy", "quality": 4, "defense": 4,
             "size": 3, "tough": 1, "cost": 100,
         })
     assert g_resp.status_code == 201
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     # Embark the infantry into the transport
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.units_state.schedule_broadcast", new=MagicMock()):
         embark_resp = await client.patch(
             f"/api/games/{code}/units/{passenger_id}",
             json={"transport_id": transport_id},
@@ -1006,7 +961,7 @@ async def test_transport_destroyed_auto_disembarks_passengers(client):
     assert embark_resp.json()["state"]["deployment_status"] == "embarked"
 
     # Destroy the transport
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.units_state.schedule_broadcast", new=MagicMock()):
         destroy_resp = await client.patch(
             f"/api/games/{code}/units/{transport_id}",
             json={"deployment_status": "destroyed"},
@@ -1025,7 +980,7 @@ async def test_transport_destroyed_auto_disembarks_passengers(client):
 
 
 @pytest.mark.asyncio
-async def test_combined_unit_merged_not_attached(client):
+async def test_combined_unit_merged_not_attached(client, fake_response):
     """Combined (doubled) squads should be merged into one unit, not treated as hero attachments."""
     resp = await client.post(
         "/api/games",
@@ -1084,15 +1039,10 @@ async def test_combined_unit_merged_not_attached(client):
     ]
 
     async def fake_get(url, *args, **kwargs):
-        class FakeResponse:
-            status_code = 200
-            def raise_for_status(self): ...
-            def json(self):
-                return {"units": fake_units, "gameSystem": "gf"}
-        return FakeResponse()
-
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), \
-         patch("app.army_forge.import_service.broadcast_to_game", new=AsyncMock()):
+        return fake_response({"units": fake_units, "gameSystem": "gf"})
+
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)), \
+         patch("app.army_forge.import_service.schedule_broadcast", new=MagicMock()):
         resp_import = await client.post(
             f"/api/proxy/import-army/{code}",
             json={
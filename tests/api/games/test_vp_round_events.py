@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -27,14 +27,15 @@ async def test_victory_points_tracking(client):
     assert resp_vp.status_code == 200
     assert resp_vp.json()["victory_points"] == 2
     
-    # Check events: should have 2 VP_CHANGED events
+    # Check events: one aggregated VP_CHANGED event
     resp_events = await client.get(f"/api/games/{code}/events")
     assert resp_events.status_code == 200
     events = resp_events.json()
     vp_events = [e for e in events if e["event_type"] == "vp_changed"]
-    assert len(vp_events) == 2
+    assert len(vp_events) == 1
+    assert vp_events[0]["details"] == {"vp_before": 0, "vp_after": 2, "delta": 2}
     
-    # Remove 1 VP - should delete one event
+    # Remove 1 VP - should shrink the entry to +1
     resp_vp2 = await client.patch(
         f"/api/games/{code}/players/{host_id}/victory-points",
         json={"delta": -1},
@@ -48,6 +49,21 @@ async def test_victory_points_tracking(client):
     events2 = resp_events2.json()
     vp_events2 = [e for e in events2 if e["event_type"] == "vp_changed"]
     assert len(vp_events2) == 1
+    assert vp_events2[0]["details"] == {"vp_before": 0, "vp_after": 1, "delta": 1}
+    assert vp_events2[0]["description"].endswith("0 → 1 (+1)")
+    
+    # +3 then -4 removes the +3 entry entirely and shrinks the +1 to nothing
+    await client.patch(
+        f"/api/games/{code}/players/{host_id}/victory-points",
+        json={"delta": 3},
+    )
+    resp_vp3 = await client.patch(
+        f"/api/games/{code}/players/{host_id}/victory-points",
+        json={"delta": -4},
+    )
+    assert resp_vp3.json()["victory_points"] == 0
+    events3 = (await client.get(f"/api/games/{code}/events")).json()
+    assert [e for e in events3 if e["event_type"] == "vp_changed"] == []
 
 
 @pytest.mark.asyncio
@@ -83,6 +99,8 @@ async def test_round_tracking(client):
     )
     assert resp_round2.status_code == 200
     assert resp_round2.json()["current_round"] == 1
+    events = (await client.get(f"/api/games/{code}/events")).json()
+    assert not [e for e in events if e["event_type"] == "round_started"]
     
     # Try to go below 1
     resp_round3 = await client.patch(
@@ -93,6 +111,44 @@ async def test_round_tracking(client):
     assert resp_round3.json()["current_round"] == 1  # Should stay at 1
 
 
+@pytest.mark.asyncio
+async def test_events_keyset_pagination(client):
+    """Paging with the X-Next-Cursor header walks every event exactly once."""
+    resp = await client.post(
+        "/api/games",
+        json={"name": "PageTest", "player_name": "Host", "player_color": "#111111"},
+    )
+    code = resp.json()["code"]
+    host_id = resp.json()["players"][0]["id"]
+    await client.post(
+        f"/api/games/{code}/join",
+        json={"player_name": "Guest", "player_color": "#222222"},
+    )
+    for _ in range(3):
+        await client.patch(
+            f"/api/games/{code}/players/{host_id}/victory-points",
+            json={"delta": 1},
+        )
+    
+    full = (await client.get(f"/api/games/{code}/events?limit=100")).json()
+    assert len(full) >= 4
+    
+    seen = []
+    url = f"/api/games/{code}/events?limit=2"
+    while True:
+        page = await client.get(url)
+        assert page.status_code == 200
+        seen.extend(e["id"] for e in page.json())
+        cursor = page.headers.get("x-next-cursor")
+        if not cursor:
+            break
+        url = f"/api/games/{code}/events?limit=2&before={cursor}"
+    assert seen == [e["id"] for e in full]
+    
+    bad = await client.get(f"/api/games/{code}/events?before=not-a-cursor")
+    assert bad.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_export_events(client):
     """Test exporting events as markdown."""
@@ -201,7 +257,7 @@ async def test_clear_events(client):
     assert len(events_before) > 0
     
     # Clear events
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.events.schedule_broadcast", new=MagicMock()):
         resp_clear = await client.delete(f"/api/games/{code}/events")
         assert resp_clear.status_code == 200
         data = resp_clear.json()
@@ -229,7 +285,11 @@ async def test_clear_events_rate_limited(client):
         json={"player_name": "Guest", "player_color": "#222222"},
     )
     guest_id = join_resp.json()["players"][1]["id"]
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with (
+        patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()),
+        patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()),
+        patch("app.api.games.events.schedule_broadcast", new=MagicMock()),
+    ):
         for _ in range(2):
             await client.post(
                 f"/api/games/{code}/units/manual",
@@ -246,3 +306,19 @@ async def test_clear_events_rate_limited(client):
         r6 = await client.delete(f"/api/games/{code}/events")
     assert r6.status_code == 429
     assert "detail" in r6.json() or "Too many" in r6.text
+
+
+@pytest.mark.asyncio
+async def test_round_and_vp_unknown_targets_404(client):
+    r = await client.patch("/api/games/NOPE99/round", json={"delta": 1})
+    assert r.status_code == 404
+    resp = await client.post(
+        "/api/games",
+        json={"name": "VP404", "player_name": "Host", "player_color": "#111111"},
+    )
+    code = resp.json()["code"]
+    r2 = await client.patch(
+        f"/api/games/{code}/players/{uuid.uuid4()}/victory-points",
+        json={"delta": 1},
+    )
+    assert r2.status_code == 404
@@ -1,5 +1,7 @@
 """Tests for ``ProxyController.get_army_forge_list`` and rate limit on import."""
 
+import json
+import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -21,21 +23,30 @@ async def test_proxy_get_army_forge_list_success(client):
                 "defense": 4,
                 "quality": 4,
                 "size": 1,
-                "loadout": [],
+                "loadout": [
+                    {
+                        "type": "ArmyBookItem",
+                        "name": "Kit",
+                        "content": [{"type": "ArmyBookWeapon", "name": "Gun", "upstreamOnly": 1}],
+                    }
+                ],
                 "rules": [],
                 "cost": 10,
             }
         ],
     }
-    with patch("app.api.proxy.httpx.AsyncClient") as acm:
-        inst = acm.return_value.__aenter__.return_value
+    with patch("app.army_forge.import_fetch.get_http_client") as gc:
+        inst = gc.return_value
         resp = MagicMock()
         resp.raise_for_status = MagicMock()
-        resp.json = MagicMock(return_value=fake)
+        resp.content = json.dumps(fake).encode()
         inst.get = AsyncMock(return_value=resp)
         r = await client.get("/api/proxy/army-forge/listid12345")
     assert r.status_code == 200
     assert r.json()["units"]
+    nested = r.json()["units"][0]["loadout"][0]["content"][0]
+    assert nested["name"] == "Gun"
+    assert "upstreamOnly" not in nested
 
 
 @pytest.mark.asyncio
@@ -45,8 +56,8 @@ async def test_proxy_get_army_forge_list_http_error(client):
     resp.status_code = 404
     resp.text = "nope"
     err = httpx.HTTPStatusError("404", request=req, response=resp)
-    with patch("app.api.proxy.httpx.AsyncClient") as acm:
-        inst = acm.return_value.__aenter__.return_value
+    with patch("app.army_forge.import_fetch.get_http_client") as gc:
+        inst = gc.return_value
         inst.get = AsyncMock(side_effect=err)
         r = await client.get("/api/proxy/army-forge/missing")
     assert r.status_code == 404
@@ -94,3 +105,39 @@ async def test_proxy_import_army_rate_limit(client):
             },
         )
     assert r.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_proxy_get_army_forge_list_cached_and_stale_fallback(client):
+    from litestar.exceptions import ValidationException
+
+    from app.army_forge import client as client_mod
+
+    fake = {"gameSystem": "gf", "units": []}
+    with patch("app.army_forge.import_fetch.download_army_forge_list", new=AsyncMock(return_value=fake)) as fetch:
+        r1 = await client.get("/api/proxy/army-forge/cachedlist1")
+        r2 = await client.get("/api/proxy/army-forge/cachedlist1")
+    assert r1.status_code == r2.status_code == 200
+    assert fetch.await_count == 1
+
+    # Expired entry is still served when Army Forge is failing...
+    ts, data = client_mod._list_cache["cachedlist1"]
+    client_mod._list_cache["cachedlist1"] = (ts - client_mod.LIST_CACHE_TTL - 1, data)
+    failing = AsyncMock(side_effect=ValidationException("Army Forge API error: 503"))
+    with patch("app.army_forge.import_fetch.download_army_forge_list", new=failing):
+        r3 = await client.get("/api/proxy/army-forge/cachedlist1")
+        # ...but with nothing cached the error propagates.
+        r4 = await client.get("/api/proxy/army-forge/otherlist99")
+    assert r3.status_code == 200
+    assert r4.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_proxy_import_army_rejects_bad_url_before_game_lookup(client):
+    # Unknown game code: a 400 (not 404) shows the URL was rejected while parsing the body
+    r = await client.post(
+        "/api/proxy/import-army/NOGAME",
+        json={"army_forge_url": "Uncaught TypeError: x is undefined", "player_id": str(uuid.uuid4())},
+    )
+    assert r.status_code == 400
+    assert "console output" in r.json()["detail"]
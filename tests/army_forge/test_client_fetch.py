@@ -1,11 +1,11 @@
-"""Tests for ``app.army_forge.client.fetch_json_get`` (mocked httpx)."""
+"""Tests for ``app.army_forge.client`` fetch helpers (mocked httpx)."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
-from app.army_forge.client import army_book_url, fetch_json_get, share_url, tts_url
+from app.army_forge.client import army_book_url, share_url, tts_url
 
 
 def test_url_helpers():
@@ -15,76 +15,99 @@ def test_url_helpers():
 
 
 @pytest.mark.asyncio
-async def test_fetch_json_get_success():
+async def test_get_with_retry_retries_gateway_errors_then_succeeds(monkeypatch):
+    from app.army_forge import client as client_mod
+
+    sleep = AsyncMock()
+    monkeypatch.setattr(client_mod.asyncio, "sleep", sleep)
+    bad = MagicMock(status_code=503)
+    good = MagicMock(status_code=200)
     client = AsyncMock()
-    resp = MagicMock()
-    resp.json.return_value = {"units": []}
-    resp.raise_for_status = MagicMock()
-    client.get = AsyncMock(return_value=resp)
-    data = await fetch_json_get(client, "http://example.com/x", timeout=5.0)
-    assert data == {"units": []}
+    client.get = AsyncMock(side_effect=[httpx.ConnectTimeout("slow"), bad, good])
+
+    assert await client_mod.get_with_retry(client, "http://x", timeout=1.0) is good
+    assert client.get.await_count == 3
+    assert sleep.await_count == 2
 
 
 @pytest.mark.asyncio
-async def test_fetch_json_get_404():
-    from litestar.exceptions import NotFoundException
+async def test_get_with_retry_gives_up_after_last_attempt(monkeypatch):
+    from app.army_forge import client as client_mod
 
+    monkeypatch.setattr(client_mod.asyncio, "sleep", AsyncMock())
+    bad = MagicMock(status_code=502)
     client = AsyncMock()
-    req = MagicMock()
-    resp = MagicMock()
-    resp.status_code = 404
-    resp.text = "missing"
-    err = httpx.HTTPStatusError("404", request=req, response=resp)
-    client.get = AsyncMock(side_effect=err)
-    with pytest.raises(NotFoundException, match="Custom missing"):
-        await fetch_json_get(client, "http://x", not_found_detail="Custom missing")
+    client.get = AsyncMock(return_value=bad)
+    assert await client_mod.get_with_retry(client, "http://x", timeout=1.0) is bad
 
+    client.get = AsyncMock(side_effect=httpx.ConnectError("down"))
+    with pytest.raises(httpx.ConnectError):
+        await client_mod.get_with_retry(client, "http://x", timeout=1.0)
+    assert client.get.await_count == client_mod.RETRY_ATTEMPTS
 
-@pytest.mark.asyncio
-async def test_fetch_json_get_500():
-    from litestar.exceptions import ValidationException
 
-    client = AsyncMock()
-    req = MagicMock()
-    resp = MagicMock()
-    resp.status_code = 500
-    resp.text = "err"
-    err = httpx.HTTPStatusError("500", request=req, response=resp)
-    client.get = AsyncMock(side_effect=err)
-    with pytest.raises(ValidationException, match="Army Forge returned an error"):
-        await fetch_json_get(client, "http://x")
+def test_list_cache_ttl_stale_read_and_eviction(monkeypatch):
+    from app.army_forge import client as client_mod
+
+    now = [100.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(client_mod, "LIST_CACHE_SIZE", 1)
+
+    assert client_mod.cached_list("a") is None
+    client_mod.remember_list("a", {"units": [1]})
+    assert client_mod.cached_list("a") == {"units": [1]}
+    now[0] += client_mod.LIST_CACHE_TTL + 1
+    assert client_mod.cached_list("a") is None
+    assert client_mod.cached_list("a", max_age=None) == {"units": [1]}
+    client_mod.remember_list("b", {"units": []})
+    assert client_mod.cached_list("a", max_age=None) is None
 
 
 @pytest.mark.asyncio
-async def test_fetch_json_get_other_status():
-    from litestar.exceptions import ValidationException
+async def test_single_flight_shares_one_fetch_between_concurrent_callers():
+    import asyncio
 
-    client = AsyncMock()
-    req = MagicMock()
-    resp = MagicMock()
-    resp.status_code = 418
-    resp.text = "tea"
-    err = httpx.HTTPStatusError("418", request=req, response=resp)
-    client.get = AsyncMock(side_effect=err)
-    with pytest.raises(ValidationException, match="418"):
-        await fetch_json_get(client, "http://x")
+    from app.army_forge import client as client_mod
 
+    gate = asyncio.Event()
+    calls = 0
 
-@pytest.mark.asyncio
-async def test_fetch_json_get_timeout():
-    from litestar.exceptions import ValidationException
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        return {"units": []}
 
-    client = AsyncMock()
-    client.get = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
-    with pytest.raises(ValidationException, match="timed out"):
-        await fetch_json_get(client, "http://x")
+    first = asyncio.ensure_future(client_mod.single_flight("k", fetch))
+    second = asyncio.ensure_future(client_mod.single_flight("k", fetch))
+    await asyncio.sleep(0)
+    gate.set()
+    assert await first == await second == {"units": []}
+    assert calls == 1
+    assert "k" not in client_mod._inflight
 
 
 @pytest.mark.asyncio
-async def test_fetch_json_get_request_error():
-    from litestar.exceptions import ValidationException
-
-    client = AsyncMock()
-    client.get = AsyncMock(side_effect=httpx.RequestError("boom", request=MagicMock()))
-    with pytest.raises(ValidationException, match="Failed to connect"):
-        await fetch_json_get(client, "http://x")
+async def test_limited_get_caps_concurrent_requests(monkeypatch):
+    import asyncio
+
+    from app.army_forge import client as client_mod
+
+    monkeypatch.setattr(client_mod, "_fetch_slots", asyncio.Semaphore(1))
+    gate = asyncio.Event()
+    active = peak = 0
+
+    async def get(url, timeout):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await gate.wait()
+        active -= 1
+        return MagicMock(status_code=200)
+
+    client = MagicMock(get=get)
+    tasks = [asyncio.ensure_future(client_mod.limited_get(client, "http://x", timeout=1.0)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert peak == 1
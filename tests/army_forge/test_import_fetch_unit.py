@@ -1,5 +1,6 @@
 """Unit tests for ``import_fetch`` with mocked httpx (no real network)."""
 
+import json
 import logging
 from unittest.mock import AsyncMock, MagicMock
 
@@ -17,7 +18,7 @@ def _resp(status: int, json_data=None, text: str = ""):
     r.status_code = status
     r.text = text or ""
     if json_data is not None:
-        r.json = MagicMock(return_value=json_data)
+        r.content = json.dumps(json_data).encode()
 
     def rf():
         if status >= 400:
@@ -13,6 +13,17 @@ def test_extract_list_id_from_share_url():
     )
 
 
+def test_extract_list_id_from_share_url_with_extra_params():
+    assert (
+        extract_list_id("https://army-forge.onepagerules.com/share?id=AbCdEf123&name=My%20List")
+        == "AbCdEf123"
+    )
+
+
+def test_extract_list_id_from_alternate_share_path():
+    assert extract_list_id("https://army-forge.onepagerules.com/share/AbCdEf123") == "AbCdEf123"
+
+
 def test_extract_list_id_raw():
     assert extract_list_id("my-list-id-12345") == "my-list-id-12345"
 
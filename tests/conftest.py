@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 import sys
 from pathlib import Path
@@ -9,6 +10,7 @@ _ROOT = Path(__file__).resolve().parents[1]
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
+import httpx
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
@@ -44,3 +46,38 @@ async def client(app) -> AsyncIterator[AsyncClient]:
         async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
             yield ac
 
+
+class FakeArmyForgeResponse:
+    """Stand-in for an httpx response from Army Forge; ``content`` is the JSON body."""
+
+    text = ""
+
+    def __init__(self, payload, status_code: int = 200):
+        self.status_code = status_code
+        self._payload = payload
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError(str(self.status_code), request=None, response=self)
+
+
+@pytest.fixture
+def fake_response():
+    """Factory for ``FakeArmyForgeResponse(payload, status_code=200)``."""
+    return FakeArmyForgeResponse
+
+
+@pytest.fixture(autouse=True)
+def _clear_army_forge_list_cache():
+    # Tests reuse fake list ids with different mocked payloads.
+    from app.army_forge import client as army_forge_client
+
+    army_forge_client._list_cache.clear()
+    yield
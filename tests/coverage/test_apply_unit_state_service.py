@@ -238,14 +238,14 @@ async def test_destroyed_detaches_hero_and_transport_passengers():
     st = _state(is_shaken=True, deployment_status=DeploymentStatus.DEPLOYED)
     u = _unit(uid, pid, state=st, attached_heroes=[hero])
     g = _game_with_unit(u)
-    # passenger in another "player"
-    p2 = MagicMock()
+    # passenger owned by another player, found by transport_id query
     pu = _unit(uuid.uuid4(), uuid.uuid4())
     pu.state = _state(transport_id=uid, deployment_status=DeploymentStatus.EMBARKED)
-    p2.units = [pu]
-    g.players = [g.players[0], p2]
     u.is_transport = True
     session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value = [pu]
+    session.execute.return_value = result
 
     with patch.object(us_mod, "log_event", new=AsyncMock()):
         await us_mod.apply_update_unit_state(
@@ -308,9 +308,11 @@ async def test_limited_weapon_used():
     session = AsyncMock()
     with patch.object(us_mod, "log_event", new=AsyncMock()) as le:
         await us_mod.apply_update_unit_state(
-            session, g, u, uid, UpdateUnitStateRequest(limited_weapons_used=["Bazooka"])
+            session, g, u, uid, UpdateUnitStateRequest(limited_weapons_used=["Rocket", "Bazooka"])
         )
+    assert le.await_count == 1
     assert le.await_args_list[0].args[2] == EventType.LIMITED_WEAPON_USED
+    assert le.await_args_list[0].kwargs["details"] == {"weapons": ["Bazooka", "Rocket"]}
 
 
 @pytest.mark.asyncio
@@ -57,7 +57,7 @@ async def test_solo_save_load_roundtrip(client):
                 "cost": 1,
             },
         )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AM()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{sc}/start")
 
     sv = await client.post(
@@ -82,13 +82,13 @@ async def test_update_unit_state_no_unit_state_validation(client):
     u = MagicMock()
     u.id = uid
     u.state = None
-    pl = MagicMock()
-    pl.units = [u]
     game = MagicMock()
-    game.players = [pl]
+    game.is_solo = True
     game.last_activity_at = None
 
-    with patch.object(us, "get_game_by_code", new=AsyncMock(return_value=game)):
+    with patch.object(us, "get_game_row", new=AsyncMock(return_value=game)), patch.object(
+        us, "get_unit_in_game", new=AsyncMock(return_value=u)
+    ):
         r = await client.patch(
             "/api/games/FAKECD/units/%s" % uid,
             json={"wounds_taken": 1},
@@ -206,7 +206,7 @@ async def test_log_action_primary_target_uuid_string(client):
 
     with patch.object(uc, "get_game_by_code", new=AsyncMock(return_value=game)):
         with patch.object(uc, "log_event", new=AsyncMock()):
-            with patch.object(uc, "broadcast_if_not_solo", new=AsyncMock()):
+            with patch.object(uc, "broadcast_if_not_solo", new=MagicMock()):
                 r = await client.post(
                     f"/api/games/FAKECD/units/{uid}/actions",
                     json={"action": "charge", "target_unit_ids": [str(tid)]},
@@ -239,7 +239,7 @@ async def test_log_action_attached_hero_gets_activated(client):
 
     with patch.object(uc, "get_game_by_code", new=AsyncMock(return_value=game)):
         with patch.object(uc, "log_event", new=AsyncMock()):
-            with patch.object(uc, "broadcast_if_not_solo", new=AsyncMock()):
+            with patch.object(uc, "broadcast_if_not_solo", new=MagicMock()):
                 r = await client.post(
                     f"/api/games/FAKECD/units/{uid}/actions",
                     json={"action": "hold"},
@@ -375,7 +375,7 @@ async def test_solo_save_load_objectives_transport_attach(client):
         },
     )
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{sc}/start")
 
     sv = await client.post(
@@ -417,7 +417,7 @@ async def test_charge_invalid_uuid_target(client):
             "cost": 1,
         },
     )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     ch = await client.post(
@@ -448,7 +448,7 @@ async def test_charge_destroyed_and_missing_target(client):
         },
     )
     tuid = tresp.json()["id"]
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     await client.patch(
@@ -469,7 +469,7 @@ async def test_charge_destroyed_and_missing_target(client):
 
 
 @pytest.mark.asyncio
-async def test_import_caster_flags_and_faction_merge_and_spell_paths(client):
+async def test_import_caster_flags_and_faction_merge_and_spell_paths(client, fake_response):
     r = await client.post(
         "/api/games",
         json={"name": "ImpFin", "player_name": "H", "player_color": "#111"},
@@ -493,24 +493,15 @@ async def test_import_caster_flags_and_faction_merge_and_spell_paths(client):
     ]
 
     async def fake_get(url, *args, **kwargs):
-        class R:
-            status_code = 200
-
-            def raise_for_status(self):
-                return None
-
-            def json(self):
-                return {
-                    "units": units,
-                    "spells": [
-                        None,
-                        {"name": "ArmyBadTh", "threshold": "no"},
-                        {"name": "ArmyBadC", "cost": "no"},
-                        {"name": "Dup", "threshold": 2},
-                    ],
-                }
-
-        return R()
+        return fake_response({
+            "units": units,
+            "spells": [
+                None,
+                {"name": "ArmyBadTh", "threshold": "no"},
+                {"name": "ArmyBadC", "cost": "no"},
+                {"name": "Dup", "threshold": 2},
+            ],
+        })
 
     book1 = {
         "factionName": "Alpha",
@@ -534,10 +525,10 @@ async def test_import_caster_flags_and_faction_merge_and_spell_paths(client):
         new=AsyncMock(return_value=book1),
     ):
         with patch(
-            "app.army_forge.import_service.httpx.AsyncClient.get",
+            "app.army_forge.client.httpx.AsyncClient.get",
             new=AsyncMock(side_effect=fake_get),
         ):
-            with patch("app.army_forge.import_service.broadcast_to_game", new=AsyncMock()):
+            with patch("app.army_forge.import_service.schedule_broadcast", new=MagicMock()):
                 i1 = await client.post(
                     f"/api/proxy/import-army/{code}",
                     json={
@@ -556,10 +547,10 @@ async def test_import_caster_flags_and_faction_merge_and_spell_paths(client):
         new=AsyncMock(return_value=book2),
     ):
         with patch(
-            "app.army_forge.import_service.httpx.AsyncClient.get",
+            "app.army_forge.client.httpx.AsyncClient.get",
             new=AsyncMock(side_effect=fake_get),
         ):
-            with patch("app.army_forge.import_service.broadcast_to_game", new=AsyncMock()):
+            with patch("app.army_forge.import_service.schedule_broadcast", new=MagicMock()):
                 i2 = await client.post(
                     f"/api/proxy/import-army/{code}",
                     json={
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -78,7 +78,48 @@ def test_check_expiration_multi_some_connected():
 
 @pytest.mark.asyncio
 async def test_broadcast_if_not_solo_skips_solo():
-    g = SimpleNamespace(is_solo=True)
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()) as m:
-        await gh.broadcast_if_not_solo(g, "AB", {})
-        m.assert_not_awaited()
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()) as m:
+        gh.broadcast_if_not_solo(True, "AB", {})
+        m.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_resolve_game_id_looks_up_upper_cased_code():
+    import uuid
+    from unittest.mock import MagicMock
+    from litestar.exceptions import NotFoundException
+
+    game_id = uuid.uuid4()
+    session = AsyncMock(info={})
+    session.execute = AsyncMock(side_effect=[
+        MagicMock(**{"scalar_one_or_none.return_value": game_id}),
+        MagicMock(**{"scalar_one_or_none.return_value": None}),
+    ])
+
+    assert await gh.resolve_game_id(session, "aaaaaa") == game_id
+    assert session.execute.await_args.args[1] == {"code": "AAAAAA"}
+    with pytest.raises(NotFoundException):
+        await gh.resolve_game_id(session, "BBBBBB")
+
+
+@pytest.mark.asyncio
+async def test_get_game_by_code_raises_on_unloaded_relationship(client, test_db_url):
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    r = await client.post(
+        "/api/games",
+        json={"name": "Raise", "player_name": "H", "player_color": "#111"},
+    )
+    code = r.json()["code"]
+
+    engine = create_async_engine(test_db_url)
+    try:
+        async with AsyncSession(engine) as session:
+            game = await gh.get_game_by_code(session, code)
+            assert game.players[0].units == []
+            with pytest.raises(InvalidRequestError):
+                game.events
+    finally:
+        await engine.dispose()
+
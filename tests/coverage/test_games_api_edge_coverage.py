@@ -47,7 +47,7 @@ async def test_join_rejects_started_or_full(client):
                 "cost": 1,
             },
         )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     j2 = await client.post(
@@ -120,7 +120,10 @@ async def test_start_game_validation_branches(client):
     st2 = await client.post(f"/api/games/{code3}/start")
     assert st2.status_code in (400, 422)
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with (
+        patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()),
+        patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()),
+    ):
         await client.post(
             f"/api/games/{code3}/units/manual",
             json={
@@ -178,10 +181,10 @@ async def test_patch_game_state_round_status_player(client):
                 "cost": 1,
             },
         )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         pr = await client.patch(
             f"/api/games/{code}/state",
             json={"current_round": 3, "status": "completed", "current_player_id": pid},
@@ -277,7 +280,7 @@ async def test_saves_reject_multiplayer_and_load_not_found(client):
                 "cost": 1,
             },
         )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{sc}/start")
 
     sa = await client.post(
@@ -314,7 +317,7 @@ async def test_units_combat_get_game_error_and_action_errors(client):
             "cost": 1,
         },
     )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     with patch(
@@ -365,7 +368,7 @@ async def test_units_combat_shaken_invalid_target_cast(client):
             "cost": 1,
         },
     )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     await client.patch(
@@ -420,7 +423,7 @@ async def test_units_combat_shaken_invalid_target_cast(client):
         f"/api/games/{code}/units/{uid}",
         json={"is_shaken": False, "spell_tokens": 4},
     )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         with patch(
             "app.api.games.units_combat.get_effective_caster",
             return_value=(True, 2),
@@ -444,7 +447,7 @@ async def test_units_combat_shaken_invalid_target_cast(client):
         f"/api/games/{code}/units/{uid}",
         json={"is_shaken": False, "spell_tokens": 4},
     )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()):
         with patch(
             "app.api.games.units_combat.get_effective_caster",
             return_value=(True, 2),
@@ -481,7 +484,7 @@ async def test_units_combat_attached_heroes_iter_raises(client):
             "cost": 1,
         },
     )
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()):
         await client.post(f"/api/games/{code}/start")
 
     class BadAttached:
@@ -510,7 +513,7 @@ async def test_units_combat_attached_heroes_iter_raises(client):
         mock_gg.return_value = game
 
         with patch("app.api.games.units_combat.log_event", new=AsyncMock()):
-            with patch("app.api.games.units_combat.broadcast_if_not_solo", new=AsyncMock()):
+            with patch("app.api.games.units_combat.broadcast_if_not_solo", new=MagicMock()):
                 r = await client.post(
                     f"/api/games/{code}/units/{uid}/actions",
                     json={"action": "hold"},
@@ -533,7 +536,10 @@ async def test_units_state_errors(client):
     )
     assert r_clear_nf.status_code == 404
 
-    with patch("app.api.game_helpers.broadcast_to_game", new=AsyncMock()):
+    with (
+        patch("app.api.games.lifecycle.schedule_broadcast", new=MagicMock()),
+        patch("app.api.game_helpers.schedule_broadcast", new=MagicMock()),
+    ):
         j = await client.post(
             f"/api/games/{code}/join",
             json={"player_name": "G", "player_color": "#222"},
@@ -681,7 +687,23 @@ async def test_delete_unit_broadcasts_when_multiplayer(client):
         },
     )
     uid = u.json()["id"]
-    with patch("app.api.games.units_state.broadcast_to_game", new=AsyncMock()) as bc:
+    with patch("app.api.games.units_state.schedule_broadcast", new=MagicMock()) as bc:
         d = await client.delete(f"/api/games/{code}/units/{uid}")
     assert d.status_code == 200
-    bc.assert_awaited()
+    bc.assert_called()
+
+
+def test_response_schemas_are_built_at_import():
+    """Forward refs would defer validator/serializer builds to the first request."""
+    from app.api import game_schemas as gs
+
+    for model in (
+        gs.GameResponse,
+        gs.GameWithUnitsResponse,
+        gs.JoinGameResponse,
+        gs.UnitResponse,
+        gs.UnitStateResponse,
+        gs.PlayerResponse,
+        gs.ObjectiveResponse,
+    ):
+        assert model.__pydantic_complete__, model.__name__
@@ -1,6 +1,6 @@
 """Extra branches in army_forge.import_service via /api/proxy/import-army."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -53,7 +53,7 @@ async def test_import_invalid_list_url(client):
 
 
 @pytest.mark.asyncio
-async def test_import_unit_loop_validation_error(client):
+async def test_import_unit_loop_validation_error(client, fake_response):
     resp = await client.post(
         "/api/games",
         json={"name": "ImpX", "player_name": "H", "player_color": "#111"},
@@ -62,32 +62,23 @@ async def test_import_unit_loop_validation_error(client):
     hid = resp.json()["players"][0]["id"]
 
     async def fake_get(url, *args, **kwargs):
-        class R:
-            status_code = 200
-
-            def raise_for_status(self):
-                return None
-
-            def json(self):
-                return {
-                    "units": [
-                        {
-                            "name": "Bad",
-                            "quality": 4,
-                            "defense": 4,
-                            "size": 1,
-                            "cost": 1,
-                            "rules": [],
-                            "selectedUpgrades": [],
-                            "id": "u1",
-                            "selectionId": "s1",
-                        }
-                    ]
+        return fake_response({
+            "units": [
+                {
+                    "name": "Bad",
+                    "quality": 4,
+                    "defense": 4,
+                    "size": 1,
+                    "cost": 1,
+                    "rules": [],
+                    "selectedUpgrades": [],
+                    "id": "u1",
+                    "selectionId": "s1",
                 }
+            ]
+        })
 
-        return R()
-
-    with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+    with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
         with patch(
             "app.army_forge.import_service.parse_special_rules",
             side_effect=RuntimeError("parse boom"),
@@ -103,7 +94,7 @@ async def test_import_unit_loop_validation_error(client):
 
 
 @pytest.mark.asyncio
-async def test_import_combined_missing_parent_listpoints_spells_rules(client):
+async def test_import_combined_missing_parent_listpoints_spells_rules(client, fake_response):
     resp = await client.post(
         "/api/games",
         json={"name": "ImpRich", "player_name": "H", "player_color": "#111"},
@@ -167,16 +158,7 @@ async def test_import_combined_missing_parent_listpoints_spells_rules(client):
     }
 
     async def fake_get(url, *args, **kwargs):
-        class R:
-            status_code = 200
-
-            def raise_for_status(self):
-                return None
-
-            def json(self):
-                return payload
-
-        return R()
+        return fake_response(payload)
 
     book = {
         "factionName": "F1",
@@ -187,10 +169,10 @@ async def test_import_combined_missing_parent_listpoints_spells_rules(client):
 
     with patch("app.army_forge.import_service.fetch_first_army_book_json", new=AsyncMock(return_value=book)):
         with patch(
-            "app.army_forge.import_service.httpx.AsyncClient.get",
+            "app.army_forge.client.httpx.AsyncClient.get",
             new=AsyncMock(side_effect=fake_get),
         ):
-            with patch("app.army_forge.import_service.broadcast_to_game", new=AsyncMock()):
+            with patch("app.army_forge.import_service.schedule_broadcast", new=MagicMock()):
                 r = await client.post(
                     f"/api/proxy/import-army/{code}",
                     json={
@@ -202,7 +184,7 @@ async def test_import_combined_missing_parent_listpoints_spells_rules(client):
 
 
 @pytest.mark.asyncio
-async def test_import_faction_merge_and_caster_from_upgrades(client):
+async def test_import_faction_merge_and_caster_from_upgrades(client, fake_response):
     resp = await client.post(
         "/api/games",
         json={"name": "ImpFac", "player_name": "H", "player_color": "#111"},
@@ -226,22 +208,13 @@ async def test_import_faction_merge_and_caster_from_upgrades(client):
     ]
 
     async def fake_get(url, *args, **kwargs):
-        class R:
-            status_code = 200
-
-            def raise_for_status(self):
-                return None
-
-            def json(self):
-                return {"units": units}
-
-        return R()
+        return fake_response({"units": units})
 
     book = {"name": "F2", "factionName": None}
 
     with patch("app.army_forge.import_service.fetch_first_army_book_json", new=AsyncMock(return_value=book)):
-        with patch("app.army_forge.import_service.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
-            with patch("app.army_forge.import_service.broadcast_to_game", new=AsyncMock()):
+        with patch("app.army_forge.client.httpx.AsyncClient.get", new=AsyncMock(side_effect=fake_get)):
+            with patch("app.army_forge.import_service.schedule_broadcast", new=MagicMock()):
                 r = await client.post(
                     f"/api/proxy/import-army/{code}",
                     json={
@@ -253,3 +226,66 @@ async def test_import_faction_merge_and_caster_from_upgrades(client):
     g = await client.get(f"/api/games/{code}")
     army = g.json()["players"][0].get("army_name") or ""
     assert "F2" in army or "Imported" in army
+
+
+@pytest.mark.asyncio
+async def test_import_into_deleted_cached_game_reports_game_not_found(client, test_db_url):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    resp = await client.post(
+        "/api/games",
+        json={"name": "ImpGone", "player_name": "H", "player_color": "#111"},
+    )
+    code = resp.json()["code"]
+    hid = resp.json()["players"][0]["id"]
+    # Caches the code -> id mapping
+    assert (await client.get(f"/api/games/{code}/events")).status_code == 200
+
+    engine = create_async_engine(test_db_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM games WHERE code = :code"), {"code": code})
+    finally:
+        await engine.dispose()
+
+    r = await client.post(
+        f"/api/proxy/import-army/{code}",
+        json={
+            "army_forge_url": "https://army-forge.onepagerules.com/share?id=FAKE12345",
+            "player_id": hid,
+        },
+    )
+    assert r.status_code == 404
+    assert "Game with code" in r.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_import_restores_expire_on_commit(client, test_db_url):
+    import uuid
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.army_forge.import_service import import_army_into_game
+
+    resp = await client.post(
+        "/api/games",
+        json={"name": "ImpExp", "player_name": "H", "player_color": "#111"},
+    )
+    code = resp.json()["code"]
+    hid = uuid.UUID(resp.json()["players"][0]["id"])
+
+    engine = create_async_engine(test_db_url)
+    try:
+        async with AsyncSession(engine) as session:
+            with patch(
+                "app.army_forge.import_service.fetch_army_list",
+                new=AsyncMock(return_value={"units": []}),
+            ), patch(
+                "app.army_forge.import_service.schedule_broadcast", new=MagicMock()
+            ):
+                result = await import_army_into_game(session, code, hid, "FAKE12345")
+            assert result.units_imported == 0
+            assert session.sync_session.expire_on_commit is True
+    finally:
+        await engine.dispose()
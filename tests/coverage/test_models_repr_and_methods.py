@@ -37,6 +37,10 @@ def test_game_repr():
     assert "AB12CD" in repr(g) and "in_progress" in repr(g)
 
 
+def test_game_code_is_stored_upper_case():
+    assert Game(name="G", code="ab12cd").code == "AB12CD"
+
+
 def test_game_save_repr():
     gid = uuid.uuid4()
     gs = GameSave(game_id=gid, save_name="slot1", game_state_json="{}")
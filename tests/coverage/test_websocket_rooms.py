@@ -1,5 +1,6 @@
 """Coverage for ``websocket.py`` ``GameRoom``, manager, ``get_game_state``, and handler paths."""
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock
 
@@ -9,6 +10,8 @@ from app.api.websocket import (
     GameRoom,
     GameRoomManager,
     broadcast_to_game,
+    debounce_broadcast,
+    schedule_broadcast,
     get_game_state,
     room_manager,
 )
@@ -19,12 +22,12 @@ async def test_game_room_broadcast_send_failure_cleans_connections():
     room = GameRoom("AB")
     p1, p2 = uuid.uuid4(), uuid.uuid4()
     w1, w2 = AsyncMock(), AsyncMock()
-    w1.send_json = AsyncMock(side_effect=RuntimeError("x"))
-    w2.send_json = AsyncMock()
+    w1.send_text = AsyncMock(side_effect=RuntimeError("x"))
+    w2.send_text = AsyncMock()
     room.connections[p1] = w1
     room.connections[p2] = w2
     aw = AsyncMock()
-    aw.send_json = AsyncMock(side_effect=RuntimeError("y"))
+    aw.send_text = AsyncMock(side_effect=RuntimeError("y"))
     room.anonymous_connections.add(aw)
     await room.broadcast({"type": "x"}, exclude=None)
     assert p1 not in room.connections
@@ -37,13 +40,71 @@ async def test_game_room_broadcast_excludes_player():
     room = GameRoom("EX")
     a, b = uuid.uuid4(), uuid.uuid4()
     wa, wb = AsyncMock(), AsyncMock()
-    wa.send_json = AsyncMock()
-    wb.send_json = AsyncMock()
+    wa.send_text = AsyncMock()
+    wb.send_text = AsyncMock()
     room.connections[a] = wa
     room.connections[b] = wb
     await room.broadcast({"t": 1}, exclude=a)
-    wa.send_json.assert_not_awaited()
-    wb.send_json.assert_awaited()
+    wa.send_text.assert_not_awaited()
+    wb.send_text.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_game_room_broadcast_sends_concurrently():
+    # The first client's send only completes once the second one has been sent to;
+    # sequential sends would hang here.
+    room = GameRoom("CC")
+    second_sent = asyncio.Event()
+
+    async def slow_send(_payload):
+        await second_sent.wait()
+
+    async def fast_send(_payload):
+        second_sent.set()
+
+    w1, w2 = AsyncMock(), AsyncMock()
+    w1.send_text = AsyncMock(side_effect=slow_send)
+    w2.send_text = AsyncMock(side_effect=fast_send)
+    room.connections[uuid.uuid4()] = w1
+    room.connections[uuid.uuid4()] = w2
+    await asyncio.wait_for(room.broadcast({"t": 1}), timeout=1)
+    w1.send_text.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_game_room_broadcast_drops_and_closes_stalled_peer(monkeypatch):
+    monkeypatch.setattr("app.api.websocket.SEND_TIMEOUT_SECONDS", 0.01)
+    room = GameRoom("SLOW")
+    slow, fast = uuid.uuid4(), uuid.uuid4()
+
+    async def stall(_payload):
+        await asyncio.sleep(1)
+
+    slow_ws, fast_ws = AsyncMock(), AsyncMock()
+    slow_ws.send_text = AsyncMock(side_effect=stall)
+    room.connections[slow] = slow_ws
+    room.connections[fast] = fast_ws
+    await room.broadcast({"type": "x"})
+    await asyncio.sleep(0)
+    assert slow not in room.connections
+    assert fast in room.connections
+    slow_ws.close.assert_awaited_once_with(code=1013, reason="Too slow")
+
+
+@pytest.mark.asyncio
+async def test_game_room_coalesces_state_updates_per_sender(monkeypatch):
+    monkeypatch.setattr("app.api.websocket.STATE_UPDATE_INTERVAL", 0)
+    room = GameRoom("SU")
+    sender, other = uuid.uuid4(), uuid.uuid4()
+    sender_ws, other_ws = AsyncMock(), AsyncMock()
+    room.connections[sender] = sender_ws
+    room.connections[other] = other_ws
+    for step in range(5):
+        room.queue_state_update(sender, {"step": step})
+    await asyncio.sleep(0.01)
+    other_ws.send_text.assert_awaited_once_with('{"type":"state_update","data":{"step":4}}')
+    sender_ws.send_text.assert_not_awaited()
+    assert room.pending_state_updates == {}
 
 
 @pytest.mark.asyncio
@@ -51,14 +112,17 @@ async def test_game_room_send_to_success_and_failure():
     room = GameRoom("CD")
     pid = uuid.uuid4()
     w = AsyncMock()
-    w.send_json = AsyncMock(side_effect=OSError("z"))
+    w.send_text = AsyncMock(side_effect=OSError("z"))
     room.connections[pid] = w
     assert await room.send_to(pid, {"a": 1}) is False
     assert pid not in room.connections
     w2 = AsyncMock()
-    w2.send_json = AsyncMock()
+    w2.send_text = AsyncMock()
     room.connections[pid] = w2
     assert await room.send_to(pid, {"b": 2}) is True
+    w2.send_text.assert_awaited_once_with('{"b":2}')
+    assert await room.send_to(pid, '{"c":3}') is True
+    w2.send_text.assert_awaited_with('{"c":3}')
 
 
 def test_game_room_add_remove_and_counts():
@@ -73,6 +137,72 @@ def test_game_room_add_remove_and_counts():
     room.remove_connection(None, w)
 
 
+def test_room_manager_state_frames_follow_generation():
+    m = GameRoomManager()
+    m.store_state_frame("AB", "frame-1", m.state_generation)
+    assert m.get_state_frame("AB") == "frame-1"
+    stale_generation = m.state_generation
+    m.invalidate_states()
+    assert m.get_state_frame("AB") is None
+    m.store_state_frame("AB", "stale", stale_generation)
+    assert m.get_state_frame("AB") is None
+    m.store_state_frame("AB", "frame-2", m.state_generation)
+    m.remove_room("ab")
+    assert m.get_state_frame("AB") is None
+
+
+def test_room_manager_invalidates_only_the_given_games():
+    m = GameRoomManager()
+    m.get_room("AB")
+    m.store_state_frame("AB", "ab-1", m.state_generation)
+    m.store_state_frame("CD", "cd-1", m.state_generation)
+    stale_generation = m.state_generation
+    m.invalidate_states({"AB", "EF"})
+    assert m.get_state_frame("AB") is None
+    assert m.get_state_frame("CD") == "cd-1"
+    m.store_state_frame("AB", "stale", stale_generation)
+    assert m.get_state_frame("AB") is None
+    m.store_state_frame("AB", "ab-2", m.state_generation)
+    assert m.get_state_frame("AB") == "ab-2"
+    m.remove_room("AB")
+    m.store_state_frame("AB", "after-removal", stale_generation)
+    assert m.get_state_frame("AB") == "after-removal"
+
+
+def test_committed_writes_drop_cached_state_frames():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.api.websocket import _STATE_WRITE_KEY, note_game_code
+
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        session.connection()
+        session.info[_STATE_WRITE_KEY] = True
+        session.rollback()
+        assert _STATE_WRITE_KEY not in session.info
+
+        generation = room_manager.state_generation
+        session.connection()
+        session.commit()
+        assert room_manager.state_generation == generation
+
+        session.connection()
+        session.info[_STATE_WRITE_KEY] = True
+        session.commit()
+        assert room_manager.state_generation == generation + 1
+
+        room_manager.store_state_frame("WRITTEN", "w", room_manager.state_generation)
+        room_manager.store_state_frame("OTHER", "o", room_manager.state_generation)
+        note_game_code(session, "WRITTEN")
+        session.connection()
+        session.info[_STATE_WRITE_KEY] = True
+        session.commit()
+        assert room_manager.get_state_frame("WRITTEN") is None
+        assert room_manager.get_state_frame("OTHER") == "o"
+        room_manager.invalidate_states({"OTHER"})
+
+
 def test_room_manager_get_remove_all():
     m = GameRoomManager()
     r1 = m.get_room("aa")
@@ -95,9 +225,95 @@ async def test_broadcast_to_game_with_connections():
     room_manager.remove_room("ZZFULL")
     r = room_manager.get_room("ZZFULL")
     w = AsyncMock()
-    w.send_json = AsyncMock()
+    w.send_text = AsyncMock()
     r.add_anonymous_connection(w)
     await broadcast_to_game("ZZFULL", {"type": "ping"})
+    w.send_text.assert_awaited_once_with('{"type":"ping"}')
+
+
+@pytest.mark.asyncio
+async def test_broadcast_to_game_passes_preencoded_payload_through():
+    room_manager.remove_room("ZZRAW")
+    r = room_manager.get_room("ZZRAW")
+    w1, w2 = AsyncMock(), AsyncMock()
+    r.add_anonymous_connection(w1)
+    r.add_connection(uuid.uuid4(), w2)
+    payload = '{"type":"state_update"}'
+    await broadcast_to_game("ZZRAW", payload)
+    w1.send_text.assert_awaited_once_with(payload)
+    w2.send_text.assert_awaited_once_with(payload)
+    room_manager.remove_room("ZZRAW")
+
+
+@pytest.mark.asyncio
+async def test_debounce_broadcast_sends_only_latest_per_key():
+    import asyncio
+
+    room_manager.remove_room("ZZDEB")
+    r = room_manager.get_room("ZZDEB")
+    w = AsyncMock()
+    r.add_anonymous_connection(w)
+    debounce_broadcast("ZZDEB", {"vp": 1}, key="a", delay=0.01)
+    debounce_broadcast("zzdeb", {"vp": 2}, key="a", delay=0.01)
+    debounce_broadcast("ZZDEB", {"vp": 9}, key="b", delay=0.01)
+    await asyncio.sleep(0.05)
+    sent = [c.args[0] for c in w.send_text.await_args_list]
+    assert sorted(sent) == ['{"vp":2}', '{"vp":9}']
+    room_manager.remove_room("ZZDEB")
+
+
+@pytest.mark.asyncio
+async def test_schedule_broadcast_logs_failures(monkeypatch, caplog):
+    import logging
+
+    async def boom(*args, **kwargs):
+        raise RuntimeError("fan-out failed")
+
+    monkeypatch.setattr("app.api.websocket.broadcast_to_game", boom)
+    with caplog.at_level(logging.ERROR, logger="Herald.WebSocket"):
+        task = schedule_broadcast("ZZFAIL", {"type": "x"})
+        with pytest.raises(RuntimeError):
+            await task
+    assert "fan-out failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_connection_flush_logs_failures(monkeypatch, caplog):
+    from app.api import websocket as ws_module
+
+    async def boom():
+        raise RuntimeError("flush failed")
+
+    monkeypatch.setattr(ws_module, "flush_connection_status", boom)
+    monkeypatch.setattr(ws_module, "CONNECTION_FLUSH_SECONDS", 0)
+    ws_module.queue_disconnect(MagicMock(), "AB", uuid.uuid4())
+    ws_module._pending_disconnects.clear()
+    with caplog.at_level("ERROR", logger="Herald.WebSocket"):
+        await asyncio.sleep(0.01)
+    assert "flush failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_lookup_joining_player_caches_rows(monkeypatch):
+    from app.api import websocket as ws_module
+
+    monkeypatch.setattr(ws_module, "JOIN_CACHE_SIZE", 1)
+    pid, other = uuid.uuid4(), uuid.uuid4()
+    result = MagicMock()
+    result.first.return_value = ("row",)
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+
+    assert await ws_module.lookup_joining_player(session, pid) == ("row",)
+    assert await ws_module.lookup_joining_player(session, pid) == ("row",)
+    assert session.execute.await_count == 1
+
+    monkeypatch.setattr(ws_module, "JOIN_CACHE_TTL", -1)
+    await ws_module.lookup_joining_player(session, pid)
+    assert session.execute.await_count == 2
+
+    await ws_module.lookup_joining_player(session, other)
+    assert pid not in ws_module._join_cache
 
 
 @pytest.mark.asyncio
@@ -218,11 +434,11 @@ async def test_get_game_state_serializes_units_states_and_objectives():
     session.execute = AsyncMock(return_value=res)
 
     data = await get_game_state(session, "abcde")
-    assert data["code"] == "ABCDE"
-    assert len(data["units"]) == 2
-    assert data["units"][0]["state"] is not None
-    assert data["units"][1]["state"] is None
-    assert len(data["objectives"]) == 1
+    assert data.code == "ABCDE"
+    assert len(data.units) == 2
+    assert data.units[0].state is not None
+    assert data.units[1].state is None
+    assert len(data.objectives) == 1
 
 
 
@@ -299,6 +515,140 @@ async def test_websocket_join_ping_state_update_unknown(sync_client):
         assert err["type"] == "error"
 
 
+@pytest.mark.asyncio
+async def test_websocket_request_state_sees_committed_changes(sync_client):
+    r = sync_client.post(
+        "/api/games",
+        json={"name": "CacheWS", "player_name": "H", "player_color": "#111"},
+    )
+    code = r.json()["code"]
+    with sync_client.websocket_connect(f"/ws/game/{code}") as socket:
+        assert len(socket.receive_json()["data"]["players"]) == 1
+        socket.send_json({"type": "request_state"})
+        assert len(socket.receive_json()["data"]["players"]) == 1
+        assert room_manager.get_state_frame(code) is not None
+
+        sync_client.post(
+            f"/api/games/{code}/join",
+            json={"player_name": "G", "player_color": "#222"},
+        )
+        socket.receive_json()  # player_joined broadcast
+        socket.send_json({"type": "request_state"})
+        assert len(socket.receive_json()["data"]["players"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_rest_write_keeps_other_games_state_frames(sync_client):
+    codes = [
+        sync_client.post(
+            "/api/games",
+            json={"name": name, "player_name": "H", "player_color": "#111"},
+        ).json()["code"]
+        for name in ("CacheA", "CacheB")
+    ]
+    with sync_client.websocket_connect(f"/ws/game/{codes[0]}") as socket_a:
+        socket_a.receive_json()
+        with sync_client.websocket_connect(f"/ws/game/{codes[1]}") as socket_b:
+            socket_b.receive_json()
+            frame_b = room_manager.get_state_frame(codes[1])
+            assert frame_b is not None
+
+            sync_client.post(
+                f"/api/games/{codes[0]}/join",
+                json={"player_name": "G", "player_color": "#222"},
+            )
+            socket_a.receive_json()  # player_joined broadcast
+            assert room_manager.get_state_frame(codes[0]) is None
+            assert room_manager.get_state_frame(codes[1]) is frame_b
+
+
+@pytest.mark.asyncio
+async def test_websocket_connect_is_written_before_player_joined(sync_client, monkeypatch):
+    import time
+
+    monkeypatch.setattr("app.api.websocket.CONNECTION_FLUSH_SECONDS", 0)
+    r = sync_client.post(
+        "/api/games",
+        json={"name": "ConnWS", "player_name": "H", "player_color": "#111"},
+    )
+    code = r.json()["code"]
+    join = sync_client.post(
+        f"/api/games/{code}/join",
+        json={"player_name": "G", "player_color": "#222"},
+    )
+    guest_id = join.json()["your_player_id"]
+
+    def guest_connected():
+        players = sync_client.get(f"/api/games/{code}").json()["players"]
+        return next(p["is_connected"] for p in players if p["id"] == guest_id)
+
+    assert guest_connected() is False
+    with sync_client.websocket_connect(f"/ws/game/{code}") as host:
+        host.receive_json()
+        with sync_client.websocket_connect(f"/ws/game/{code}") as guest:
+            guest.receive_json()
+            guest.send_json({"type": "join", "player_id": guest_id})
+            assert host.receive_json()["type"] == "player_joined"
+            # What a peer's refetch on player_joined reads
+            assert guest_connected() is True
+    time.sleep(0.05)
+    assert guest_connected() is False
+
+
+@pytest.mark.asyncio
+async def test_websocket_reconnect_cancels_queued_disconnect(sync_client, monkeypatch):
+    import time
+
+    from app.api import websocket as ws_module
+
+    monkeypatch.setattr(ws_module, "CONNECTION_FLUSH_SECONDS", 60)
+    monkeypatch.setattr(ws_module, "_pending_disconnects", {})
+    r = sync_client.post(
+        "/api/games",
+        json={"name": "ReconnWS", "player_name": "H", "player_color": "#111"},
+    )
+    code = r.json()["code"]
+    host_id = r.json()["players"][0]["id"]
+
+    def wait_for_queued_disconnect():
+        for _ in range(100):
+            if any(ws_module._pending_disconnects.values()):
+                return
+            time.sleep(0.01)
+        raise AssertionError("disconnect was not queued")
+
+    for _ in range(2):
+        with sync_client.websocket_connect(f"/ws/game/{code}") as socket:
+            socket.receive_json()
+            socket.send_json({"type": "join", "player_id": host_id})
+            socket.send_json({"type": "ping"})
+            assert socket.receive_json()["type"] == "pong"
+            assert not any(ws_module._pending_disconnects.values())
+            sync_client.blocking_portal.call(ws_module.flush_connection_status)
+        wait_for_queued_disconnect()
+    sync_client.blocking_portal.call(ws_module.flush_connection_status)
+    players = sync_client.get(f"/api/games/{code}").json()["players"]
+    assert players[0]["is_connected"] is False
+
+
+@pytest.mark.asyncio
+async def test_websocket_state_includes_unit_state_without_lazy_loads(sync_client):
+    r = sync_client.post(
+        "/api/games",
+        json={"name": "UnitsWS", "player_name": "H", "player_color": "#111"},
+    )
+    code = r.json()["code"]
+    host_id = r.json()["players"][0]["id"]
+    sync_client.post(
+        f"/api/games/{code}/units/manual",
+        json={"player_id": host_id, "name": "Squad", "quality": 4, "defense": 4, "size": 3, "cost": 90},
+    )
+    with sync_client.websocket_connect(f"/ws/game/{code}") as socket:
+        units = socket.receive_json()["data"]["units"]
+    assert [u["name"] for u in units] == ["Squad"]
+    assert units[0]["state"]["models_remaining"] == 3
+
+
 @pytest.mark.asyncio
 async def test_websocket_join_invalid_player_id(sync_client):
     r = sync_client.post(